@@ -27,6 +27,10 @@ from .models import AgentStep, ResearchResult
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# web_search's failover budget ends this long before the tool timeout, so
+# the search can still return partial results / errors before it is cancelled
+WEB_SEARCH_BUDGET_MARGIN_SECONDS = 5.0
+
 
 class ResearcherAgent:
     """
@@ -239,17 +243,19 @@ Approve only if the report covers the query, cites authoritative sources, and ad
             f"pipeline={'enabled' if content_pipeline else 'disabled'}, "
             f"websocket={'enabled' if websocket_manager else 'disabled'})"
         )
+
+    # Typographic punctuation -> ASCII, applied in a single translate() pass
+    _WINDOWS_PUNCT_TABLE = str.maketrans({
+        '\u2014': '-', '\u2013': '-', '\u2012': '-',
+        '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+        '\u2026': '...',
+    })
+
     def _normalize_for_windows(self, s: str) -> str:
         if not s:
             return s
-        repl={
-            '—':'-','–':'-','‒':'-',
-            '‘':''', '’':''', '“':'"', '”':'"',
-            '…':'...'
-        }
-        for k,v in repl.items():
-            s=s.replace(k,v)
-        return s
+        return s.translate(self._WINDOWS_PUNCT_TABLE)
+
     async def research(
         self, query: str, session_id: Optional[str] = None
     ) -> ResearchResult:
@@ -370,6 +376,8 @@ Approve only if the report covers the query, cites authoritative sources, and ad
                         # Allow tool-call-only replies; we synthesize a thought if content is empty
                         require_tool_calls=True,
                         require_content=False,
+                        # System prompt and tool schema repeat every iteration
+                        cache_prefix=True,
                     )
 
                     step_latency = time.time() - step_start
@@ -951,6 +959,18 @@ Approve only if the report covers the query, cites authoritative sources, and ad
                     self.preferred_date_filter,
                 )
 
+            if self.tool_settings and getattr(self.tool_settings, "web_search_speculative", False):
+                web_kwargs.setdefault("speculative", True)
+            if self.tool_settings and getattr(self.tool_settings, "web_search_hedge", False):
+                web_kwargs.setdefault("hedge", True)
+
+            # Failover budget: just inside the tool timeout applied around
+            # this call, so web_search's own budget handling runs first
+            tool_timeout = self._get_tool_timeout_seconds("web_search")
+            if tool_timeout:
+                margin = min(WEB_SEARCH_BUDGET_MARGIN_SECONDS, tool_timeout * 0.1)
+                web_kwargs.setdefault("overall_timeout", tool_timeout - margin)
+
             return await web_search(
                 content_pipeline=self.content_pipeline,
                 **web_kwargs
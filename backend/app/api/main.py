@@ -19,6 +19,8 @@ from .routes import (
 from .websocket import router as websocket_router
 from .dependencies import initialize_dependencies
 from ..database import init_database, close_database
+from ..tools.web_search import close_web_search_client
+from ..llm.openai_provider import close_shared_http_client
 from ..config import load_settings
 
 logger = logging.getLogger(__name__)
@@ -90,6 +92,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down FastAPI application...")
 
+    # Close shared web search HTTP client
+    await close_web_search_client()
+
+    # Close the HTTP client shared by OpenAI providers
+    await close_shared_http_client()
+
     # Close database
     await close_database()
 
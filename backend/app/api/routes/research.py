@@ -35,6 +35,7 @@ from ...database import (
     save_end_to_end_evaluation,
 )
 from ...agents import ResearcherAgent, EvaluatorAgent
+from ...evaluation import EvaluationPayload
 from ...llm import LLMManager, LLMProvider
 from ...config import Settings, get_llm_config_dict
 from ...content import ContentPipeline
@@ -369,17 +370,9 @@ async def _run_research_session(
         if eval_result.end_to_end_evaluation:
             await save_end_to_end_evaluation(
                 session_id=session_id,
-                evaluation={
-                    "relevance_score": eval_result.end_to_end_evaluation.relevance_score,
-                    "accuracy_score": eval_result.end_to_end_evaluation.accuracy_score,
-                    "completeness_score": eval_result.end_to_end_evaluation.completeness_score,
-                    "source_quality_score": eval_result.end_to_end_evaluation.source_quality_score,
-                    "strengths": eval_result.end_to_end_evaluation.strengths,
-                    "weaknesses": eval_result.end_to_end_evaluation.weaknesses,
-                    "recommendations": eval_result.end_to_end_evaluation.recommendations,
-                    "tokens_used": eval_result.end_to_end_evaluation.tokens_used,
-                    "cost_usd": eval_result.end_to_end_evaluation.cost_usd,
-                },
+                evaluation=EvaluationPayload.from_evaluation(
+                    eval_result.end_to_end_evaluation
+                ),
             )
 
         # Finalize metrics collection with evaluation data
@@ -532,6 +525,21 @@ def _normalize_request_config(request: StartResearchRequest) -> Optional[Dict[st
     return base_config if base_config else None
 
 
+def _copy_settings_for_session(base_settings: Settings) -> Settings:
+    """
+    Copy the parts of Settings that session overrides modify.
+
+    Overrides only reassign fields on the llm and research sections, so
+    shallow copies of those are enough and the rest of the tree is shared
+    instead of deep-copied per request. Provider configs are frozen and
+    replaced rather than modified, so they are shared as well.
+    """
+    return base_settings.model_copy(update={
+        "llm": base_settings.llm.model_copy(),
+        "research": base_settings.research.model_copy(),
+    })
+
+
 def _prepare_session_context(
     base_settings: Settings,
     base_llm_manager: LLMManager,
@@ -543,7 +551,7 @@ def _prepare_session_context(
     if not session_config:
         return base_settings, base_llm_manager, None
 
-    session_settings = base_settings.copy(deep=True)
+    session_settings = _copy_settings_for_session(base_settings)
 
     llm_overrides = session_config.get("llm") or {}
     research_overrides = session_config.get("research") or {}
@@ -642,7 +650,12 @@ def _apply_model_override(
         )
         return
 
-    provider_cfg.model = requested_model
+    # LLMConfig is frozen; swap in a copy carrying the requested model
+    setattr(
+        session_settings.llm,
+        provider_name,
+        provider_cfg.model_copy(update={"model": requested_model}),
+    )
 
 
 def _log_research_start(
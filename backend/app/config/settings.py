@@ -6,14 +6,32 @@ Centralized configuration management using Pydantic.
 
 import os
 import yaml
-from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, Field
+from typing import Dict, Any, Optional, List, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 from pathlib import Path
 
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed config files: resolved path -> ((mtime_ns, size), data). Holds the raw
+# YAML data so env placeholders are still resolved on every load
+_yaml_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
 
 class LLMConfig(BaseModel):
     """LLM provider configuration."""
 
+    # Built once from config.yaml and only read afterwards; frozen also lets
+    # pydantic pass instances through nested validation without re-checking
+    model_config = ConfigDict(
+        frozen=True,
+        revalidate_instances="never",
+        extra="ignore",
+    )
+
     api_key: Optional[str] = None
     model: str
     temperature: Optional[float] = 0.7
@@ -53,6 +71,8 @@ class ToolsSettings(BaseModel):
     # Web search settings (automatic provider failover)
     web_search_max_results: int = 10
     web_search_timeout_seconds: int = 90  # Total timeout for all providers
+    web_search_speculative: bool = False  # Query all providers at once (each one is billed)
+    web_search_hedge: bool = False  # Start the next provider early when the current one is slow
     tool_execution_timeout_seconds: int = 60  # Generic safety timeout per tool call
 
     # Search provider API keys (all optional, system tries in order)
@@ -178,8 +198,7 @@ def load_settings(config_path: str = "config.yaml") -> Settings:
     if not config_file.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_file, "r") as f:
-        config = yaml.safe_load(f)
+    config = _load_yaml(config_file)
 
     # Replace environment variable placeholders
     config = _replace_env_vars(config)
@@ -188,6 +207,29 @@ def load_settings(config_path: str = "config.yaml") -> Settings:
     return Settings(**config)
 
 
+def _load_yaml(config_file: Path) -> Any:
+    """
+    Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    Args:
+        config_file: Path to the YAML file
+
+    Returns:
+        Parsed YAML data (not to be mutated by callers)
+    """
+    stat = config_file.stat()
+    path = str(config_file.resolve())
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(config_file, "r") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    _yaml_cache[path] = (version, data)
+    return data
+
+
 def _replace_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Replace ${ENV_VAR} or ${ENV_VAR:default} placeholders with environment variable values.
@@ -245,25 +287,23 @@ def get_llm_config_dict(settings: Settings) -> Dict[str, Any]:
     }
 
     # Include all providers with API keys (no filtering)
-    if settings.llm.openai and settings.llm.openai.api_key:
+    openai_cfg = settings.llm.openai
+    if openai_cfg and openai_cfg.api_key:
+        # Empty reasoning_effort / alternate_models map to None so a single
+        # "is not None" filter drops every unset option
         llm_config["openai"] = {
-            "api_key": settings.llm.openai.api_key,
-            "model": settings.llm.openai.model,
-        }
-        if settings.llm.openai.temperature is not None:
-            llm_config["openai"]["temperature"] = settings.llm.openai.temperature
-        if settings.llm.openai.max_tokens is not None:
-            llm_config["openai"]["max_tokens"] = settings.llm.openai.max_tokens
-        if settings.llm.openai.max_completion_tokens is not None:
-            llm_config["openai"]["max_completion_tokens"] = (
-                settings.llm.openai.max_completion_tokens
+            key: value
+            for key, value in (
+                ("api_key", openai_cfg.api_key),
+                ("model", openai_cfg.model),
+                ("temperature", openai_cfg.temperature),
+                ("max_tokens", openai_cfg.max_tokens),
+                ("max_completion_tokens", openai_cfg.max_completion_tokens),
+                ("reasoning_effort", openai_cfg.reasoning_effort or None),
+                ("alternate_models", openai_cfg.alternate_models or None),
             )
-        if settings.llm.openai.reasoning_effort:
-            llm_config["openai"]["reasoning_effort"] = (
-                settings.llm.openai.reasoning_effort
-            )
-        if settings.llm.openai.alternate_models:
-            llm_config["openai"]["alternate_models"] = settings.llm.openai.alternate_models
+            if value is not None
+        }
 
     if settings.llm.gemini and settings.llm.gemini.api_key:
         llm_config["gemini"] = {
@@ -19,6 +19,7 @@ from .database import (
     get_session,
     update_session,
     save_trace_event,
+    save_trace_events_bulk,
     save_per_step_evaluation,
     save_end_to_end_evaluation,
     get_session_trace,
@@ -38,6 +39,7 @@ __all__ = [
     "get_session",
     "update_session",
     "save_trace_event",
+    "save_trace_events_bulk",
     "save_end_to_end_evaluation",
     "get_session_trace",
     "get_session_evaluations",
@@ -4,15 +4,27 @@ Database Utilities
 Functions for database initialization and common operations.
 """
 
+import hashlib
+import json
 import logging
 import uuid
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Union
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
     async_sessionmaker,
 )
-from sqlalchemy import select
+from sqlalchemy import event, select
+
+# Optional: orjson serializes JSON columns several times faster than json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .models import (
     Base,
@@ -20,6 +32,7 @@ from .models import (
     TraceEvent,
     EndToEndEvaluation,
 )
+from ..evaluation import EvaluationPayload
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +40,56 @@ logger = logging.getLogger(__name__)
 _engine = None
 _async_session_maker = None
 
+# Applied to every new SQLite connection: WAL lets readers run alongside the
+# trace-event writer, and busy_timeout waits out lock contention instead of
+# failing immediately
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "busy_timeout=5000",
+    "temp_store=MEMORY",
+)
+
+
+# Content hash -> row id of recently bulk-saved trace events (bounded LRU).
+# A repeat of one of these is stored as a reference row whose data is
+# {TRACE_REF_KEY: original_id}; get_session_trace resolves it again. Reset
+# whenever the database is (re)initialized or closed.
+TRACE_DEDUP_CACHE_SIZE = 4096
+TRACE_REF_KEY = "$ref"
+_recent_trace_ids: "OrderedDict[str, int]" = OrderedDict()
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value)
+
+
+def _trace_event_hash(event: Dict[str, Any]) -> str:
+    """Content hash over a trace event's session, type, iteration and data."""
+    key = [event["session_id"], event["event_type"], event.get("iteration"), event["data"]]
+    if ORJSON_AVAILABLE:
+        canonical = orjson.dumps(
+            key,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+    else:
+        canonical = json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2s(canonical, digest_size=16).hexdigest()
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Connection listener applying SQLITE_PRAGMAS."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
 
 async def init_database(database_url: str, echo: bool = False):
     """
@@ -39,9 +102,14 @@ async def init_database(database_url: str, echo: bool = False):
     global _engine, _async_session_maker
 
     logger.info(f"Initializing database: {database_url}")
+    _recent_trace_ids.clear()
 
     # Create async engine
-    _engine = create_async_engine(database_url, echo=echo)
+    _engine = create_async_engine(
+        database_url, echo=echo, json_serializer=_json_serializer
+    )
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine.sync_engine, "connect", _set_sqlite_pragmas)
 
     # Create session maker
     _async_session_maker = async_sessionmaker(
@@ -120,18 +188,23 @@ async def get_session(session_id: str) -> Optional[ResearchSession]:
 
 
 async def update_session(
-    session_id: str, **kwargs
+    session_id: str, payload: Optional[Dict[str, Any]] = None, **kwargs
 ) -> Optional[ResearchSession]:
     """
     Update research session.
 
+    All fields are applied together and flushed as a single UPDATE.
+
     Args:
         session_id: Session identifier
-        **kwargs: Fields to update
+        payload: Dict of fields to update
+        **kwargs: Additional fields to update (override payload)
 
     Returns:
         Updated ResearchSession or None if not found
     """
+    fields = {**payload, **kwargs} if payload else kwargs
+
     async with await get_database() as db:
         result = await db.execute(
             select(ResearchSession).where(ResearchSession.id == session_id)
@@ -139,12 +212,13 @@ async def update_session(
         session = result.scalar_one_or_none()
 
         if session:
-            for key, value in kwargs.items():
+            for key, value in fields.items():
                 if hasattr(session, key):
                     setattr(session, key, value)
 
+            # No server-side defaults change on update, and expire_on_commit
+            # is off, so the instance is current without a refresh SELECT
             await db.commit()
-            await db.refresh(session)
             logger.info(f"Updated session {session_id}")
 
         return session
@@ -182,6 +256,70 @@ async def save_trace_event(
         return event
 
 
+async def save_trace_events_bulk(events: List[Dict[str, Any]]) -> int:
+    """
+    Save a batch of trace events in a single transaction.
+
+    An event identical (same session, type, iteration and data) to one saved
+    recently is stored as a small reference row pointing at the original
+    instead of repeating its data; get_session_trace expands it again.
+
+    Args:
+        events: Dicts with session_id, event_type, data and optional iteration
+
+    Returns:
+        Number of events saved
+    """
+    if not events:
+        return 0
+
+    async with await get_database() as db:
+        originals: Dict[str, TraceEvent] = {}
+        repeats = []
+        for event in events:
+            # Stamped here so repeats (inserted last) keep their batch order
+            timestamp = datetime.utcnow()
+            digest = _trace_event_hash(event)
+            if digest in _recent_trace_ids or digest in originals:
+                repeats.append((event, digest, timestamp))
+                continue
+            row = TraceEvent(
+                session_id=event["session_id"],
+                type=event["event_type"],
+                iteration=event.get("iteration"),
+                data=event["data"],
+                timestamp=timestamp,
+            )
+            originals[digest] = row
+            db.add(row)
+
+        # Assign ids to this batch's originals so repeats can point at them
+        if originals:
+            await db.flush()
+            for digest, row in originals.items():
+                _recent_trace_ids[digest] = row.id
+                _recent_trace_ids.move_to_end(digest)
+
+        for event, digest, timestamp in repeats:
+            original_id = (
+                originals[digest].id if digest in originals else _recent_trace_ids[digest]
+            )
+            _recent_trace_ids.move_to_end(digest)
+            db.add(TraceEvent(
+                session_id=event["session_id"],
+                type=event["event_type"],
+                iteration=event.get("iteration"),
+                data={TRACE_REF_KEY: original_id},
+                timestamp=timestamp,
+            ))
+
+        while len(_recent_trace_ids) > TRACE_DEDUP_CACHE_SIZE:
+            _recent_trace_ids.popitem(last=False)
+        await db.commit()
+
+    return len(events)
+
+
 async def save_per_step_evaluation(
     session_id: str, iteration: int, evaluation: Dict[str, Any]
 ) -> None:
@@ -205,18 +343,21 @@ async def save_per_step_evaluation(
 
 
 async def save_end_to_end_evaluation(
-    session_id: str, evaluation: Dict[str, Any]
+    session_id: str, evaluation: Union[EvaluationPayload, Dict[str, Any]]
 ) -> EndToEndEvaluation:
     """
     Save end-to-end evaluation.
 
     Args:
         session_id: Session identifier
-        evaluation: Evaluation data
+        evaluation: Evaluation payload (or equivalent dict of column values)
 
     Returns:
         Created EndToEndEvaluation
     """
+    if isinstance(evaluation, EvaluationPayload):
+        evaluation = evaluation.to_dict()
+
     async with await get_database() as db:
         eval_record = EndToEndEvaluation(
             session_id=session_id, **evaluation
@@ -244,7 +385,19 @@ async def get_session_trace(session_id: str) -> list[TraceEvent]:
             .where(TraceEvent.session_id == session_id)
             .order_by(TraceEvent.timestamp)
         )
-        return list(result.scalars().all())
+        events = list(result.scalars().all())
+
+    # Expand reference rows written by save_trace_events_bulk; originals are
+    # always in the same session. Done after the DB session closes so the
+    # expanded data is never flushed back.
+    by_id = {event.id: event for event in events}
+    for event in events:
+        data = event.data
+        if isinstance(data, dict) and len(data) == 1 and TRACE_REF_KEY in data:
+            original = by_id.get(data[TRACE_REF_KEY])
+            if original is not None:
+                event.data = original.data
+    return events
 
 
 async def get_session_evaluations(
@@ -279,6 +432,7 @@ async def close_database():
     """Close database connection."""
     global _engine
 
+    _recent_trace_ids.clear()
     if _engine:
         await _engine.dispose()
         logger.info("Database connection closed")
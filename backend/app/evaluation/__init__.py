@@ -0,0 +1,9 @@
+"""
+Evaluation Persistence Helpers
+
+Lightweight containers for passing evaluation results to the database layer.
+"""
+
+from .payload import EvaluationPayload
+
+__all__ = ["EvaluationPayload"]
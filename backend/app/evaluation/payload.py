@@ -0,0 +1,61 @@
+"""
+Evaluation Payload
+
+Slotted, immutable container for an end-to-end evaluation on its way to the
+database.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+
+@dataclass(slots=True, frozen=True)
+class EvaluationPayload:
+    """
+    End-to-end evaluation fields stored with a research session.
+    Uses 0-1 scale for all scores.
+    """
+
+    relevance_score: float
+    accuracy_score: float
+    completeness_score: float
+    source_quality_score: float
+    strengths: List[str]
+    weaknesses: List[str]
+    recommendations: List[str]
+    tokens_used: int
+    cost_usd: float
+
+    @classmethod
+    def from_evaluation(cls, evaluation: Any) -> "EvaluationPayload":
+        """
+        Build a payload from an EndToEndEval (or any object with the same fields).
+
+        Args:
+            evaluation: Source evaluation object
+
+        Returns:
+            EvaluationPayload with the persisted fields copied over
+        """
+        return cls(
+            relevance_score=evaluation.relevance_score,
+            accuracy_score=evaluation.accuracy_score,
+            completeness_score=evaluation.completeness_score,
+            source_quality_score=evaluation.source_quality_score,
+            strengths=evaluation.strengths,
+            weaknesses=evaluation.weaknesses,
+            recommendations=evaluation.recommendations,
+            tokens_used=evaluation.tokens_used,
+            cost_usd=evaluation.cost_usd,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a column-name -> value dict.
+
+        Unlike dataclasses.asdict this does not deep-copy the list fields.
+
+        Returns:
+            Dict suitable for EndToEndEvaluation(**payload)
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
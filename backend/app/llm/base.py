@@ -33,6 +33,7 @@ class BaseLLMProvider(ABC):
         temperature: float = 0.7,
         max_tokens: int = 2000,
         tool_choice: Optional[Any] = None,
+        cache_prefix: bool = False,
     ) -> Dict[str, Any]:
         """
         Generate completion with optional tool calling support.
@@ -42,6 +43,8 @@ class BaseLLMProvider(ABC):
             tools: Optional list of tool definitions for function calling
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens to generate
+            cache_prefix: Hint that the system prompt and tools are stable
+                across calls and should be marked for provider prompt caching
 
         Returns:
             Dict containing:
@@ -90,3 +93,12 @@ class BaseLLMProvider(ABC):
             Estimated cost in USD
         """
         pass
+
+    async def warmup(self) -> None:
+        """
+        Open the provider's HTTP connection ahead of the first real request.
+
+        Optional hook; the default does nothing. Implementations must not
+        raise, since warmup runs in the background alongside real work.
+        """
+        return None
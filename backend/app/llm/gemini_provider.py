@@ -7,6 +7,7 @@ Implements the BaseLLMProvider interface for Google's Gemini API.
 import logging
 import json
 from collections.abc import Mapping, Sequence
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 import google.generativeai as genai
 
@@ -14,6 +15,60 @@ from .base import BaseLLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Schema fields Gemini function declarations accept
+_GEMINI_SCHEMA_FIELDS = frozenset({
+    "type", "nullable", "required", "format",
+    "description", "properties", "items", "enum",
+    "anyOf", "$ref", "$defs"
+})
+
+
+def _clean_properties(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    return {k: _clean_schema(v) for k, v in value.items()}
+
+
+def _clean_any_of(value: Any) -> Any:
+    if not isinstance(value, list):
+        return value
+    return [_clean_schema(item) for item in value]
+
+
+def _clean_enum(value: Any) -> Any:
+    # Filter out None from enum lists; None-free enums are kept as-is
+    if not isinstance(value, list) or None not in value:
+        return value
+    return [v for v in value if v is not None]
+
+
+def _clean_schema(schema: Any) -> Any:
+    """Recursively drop schema fields Gemini does not support."""
+    if not isinstance(schema, dict):
+        return schema
+
+    # Unsupported fields like default, minimum, maximum are skipped
+    return {
+        key: _FIELD_CLEANERS[key](value) if key in _FIELD_CLEANERS else value
+        for key, value in schema.items()
+        if key in _GEMINI_SCHEMA_FIELDS
+    }
+
+
+# Per-field rewrite applied to kept keys; fields not listed pass through as-is
+_FIELD_CLEANERS = {
+    "properties": _clean_properties,
+    "items": _clean_schema,
+    "anyOf": _clean_any_of,
+    "enum": _clean_enum,
+}
+
+
+@lru_cache(maxsize=256)
+def _clean_schema_cached(schema_json: str) -> Dict[str, Any]:
+    """Clean a schema given as JSON; shared result, do not mutate."""
+    return _clean_schema(json.loads(schema_json))
+
 
 class GeminiProvider(BaseLLMProvider):
     """
@@ -52,6 +107,7 @@ class GeminiProvider(BaseLLMProvider):
         temperature: float = 0.7,
         max_tokens: int = 2000,
         tool_choice: Optional[Any] = None,
+        cache_prefix: bool = False,
     ) -> Dict[str, Any]:
         """
         Generate completion using Gemini API.
@@ -61,6 +117,8 @@ class GeminiProvider(BaseLLMProvider):
             tools: Optional list of tool definitions for function calling
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens to generate
+            cache_prefix: Accepted for interface parity; Gemini 2.5 models
+                cache repeated prefixes implicitly
 
         Returns:
             Dict containing completion result and metadata
@@ -269,44 +327,19 @@ class GeminiProvider(BaseLLMProvider):
             schema: OpenAPI schema dictionary
 
         Returns:
-            Cleaned schema compatible with Gemini
+            Cleaned schema compatible with Gemini (shared; treat as read-only)
         """
         if not isinstance(schema, dict):
             return schema
 
-        # Allowed fields per Gemini docs
-        allowed_fields = {
-            "type", "nullable", "required", "format",
-            "description", "properties", "items", "enum",
-            "anyOf", "$ref", "$defs"
-        }
-
-        cleaned = {}
-
-        for key, value in schema.items():
-            if key not in allowed_fields:
-                continue  # Skip unsupported fields like default, minimum, maximum
-
-            # Recursively clean nested objects
-            if key == "properties" and isinstance(value, dict):
-                cleaned[key] = {
-                    k: self._clean_schema_for_gemini(v)
-                    for k, v in value.items()
-                }
-            elif key == "items" and isinstance(value, dict):
-                cleaned[key] = self._clean_schema_for_gemini(value)
-            elif key == "anyOf" and isinstance(value, list):
-                cleaned[key] = [
-                    self._clean_schema_for_gemini(item)
-                    for item in value
-                ]
-            elif key == "enum" and isinstance(value, list):
-                # Filter out None from enum lists
-                cleaned[key] = [v for v in value if v is not None]
-            else:
-                cleaned[key] = value
-
-        return cleaned
+        # Tool schemas are static, so each distinct schema is cleaned once;
+        # the cached result is shared and must not be mutated. Keys stay in
+        # their original order: it sets the property order the model sees
+        try:
+            schema_json = json.dumps(schema)
+        except (TypeError, ValueError):
+            return _clean_schema(schema)
+        return _clean_schema_cached(schema_json)
 
     def _get_function_name_from_tool_call_id(
         self, messages: List[Dict[str, Any]], tool_call_id: str
@@ -0,0 +1,35 @@
+"""
+HTTP Client Settings
+
+Shared connection-pool settings for the httpx clients used by LLM providers.
+"""
+
+from typing import Any, Dict
+
+import httpx
+
+# Optional: HTTP/2 needs the h2 package (installed via httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Providers live for the lifetime of LLMManager, so keep connections warm
+# between ReAct iterations instead of re-handshaking TLS per request
+LLM_HTTP_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=60,
+)
+
+
+def pooled_client_kwargs() -> Dict[str, Any]:
+    """
+    Keyword arguments for a pooled, HTTP/2-capable httpx.AsyncClient.
+
+    Returns:
+        Dict with ``http2`` (enabled when h2 is installed) and ``limits``
+    """
+    return {"http2": HTTP2_AVAILABLE, "limits": LLM_HTTP_LIMITS}
@@ -4,13 +4,16 @@ LLM Manager
 Manages multiple LLM providers with automatic fallback support.
 """
 
+import asyncio
 import logging
 from collections import defaultdict
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from functools import partial
+from typing import Dict, Any, Callable, Iterator, List, Optional
 
 from .base import BaseLLMProvider, LLMProvider
-from .openai_provider import OpenAIProvider
+from .openai_provider import OpenAIProvider, get_shared_http_client
 from .gemini_provider import GeminiProvider
 from .openrouter_provider import OpenRouterProvider
 
@@ -18,6 +21,41 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+class _LazyProviderMap(Mapping):
+    """
+    Provider registry that constructs each provider on first access.
+
+    Membership and iteration only look at what is configured, so building
+    an LLMManager does not create SDK/HTTP clients for providers that a
+    run never calls.
+    """
+
+    def __init__(self):
+        self._factories: Dict[LLMProvider, Callable[[], BaseLLMProvider]] = {}
+        self._instances: Dict[LLMProvider, BaseLLMProvider] = {}
+
+    def register(
+        self, provider_type: LLMProvider, factory: Callable[[], BaseLLMProvider]
+    ) -> None:
+        self._factories[provider_type] = factory
+
+    def __getitem__(self, provider_type: LLMProvider) -> BaseLLMProvider:
+        provider = self._instances.get(provider_type)
+        if provider is None:
+            provider = self._factories[provider_type]()
+            self._instances[provider_type] = provider
+        return provider
+
+    def __contains__(self, provider_type: object) -> bool:
+        return provider_type in self._factories
+
+    def __iter__(self) -> Iterator[LLMProvider]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+
 class LLMManager:
     """
     Manages multiple LLM providers with automatic fallback.
@@ -49,47 +87,48 @@ class LLMManager:
                     "openrouter": {"api_key": "...", "model": "..."}
                 }
         """
-        self.providers: Dict[LLMProvider, BaseLLMProvider] = {}
+        self.providers = _LazyProviderMap()
         self.primary_provider: Optional[LLMProvider] = None
         self.fallback_order: List[LLMProvider] = []
         self.provider_failure_counts = defaultdict(int)
         self.disabled_providers: Dict[LLMProvider, datetime] = {}
         self.failure_threshold = 2
 
-        # Initialize OpenAI provider if configured
+        # Providers are registered here and constructed on first use
         if config.get("openai"):
             openai_cfg = config["openai"]
-            self.providers[LLMProvider.OPENAI] = OpenAIProvider(
+            self.providers.register(LLMProvider.OPENAI, lambda: OpenAIProvider(
                 api_key=openai_cfg["api_key"],
                 model=openai_cfg.get("model", "gpt-5-nano"),
                 temperature=openai_cfg.get("temperature"),
                 max_tokens=openai_cfg.get("max_tokens"),
                 max_completion_tokens=openai_cfg.get("max_completion_tokens"),
                 reasoning_effort=openai_cfg.get("reasoning_effort"),
-            )
+                http_client=get_shared_http_client(),
+            ))
             logger.info(
-                f"Initialized OpenAI provider with model: "
+                f"Configured OpenAI provider with model: "
                 f"{config['openai'].get('model', 'gpt-5-nano')}"
             )
 
-        # Initialize Gemini provider if configured
         if config.get("gemini"):
-            self.providers[LLMProvider.GEMINI] = GeminiProvider(
+            self.providers.register(LLMProvider.GEMINI, partial(
+                GeminiProvider,
                 api_key=config["gemini"]["api_key"],
                 model=config["gemini"].get("model", "gemini-2.5-flash"),
-            )
-            logger.info("Initialized Gemini provider")
+            ))
+            logger.info("Configured Gemini provider")
 
-        # Initialize OpenRouter provider if configured
         if config.get("openrouter"):
-            self.providers[LLMProvider.OPENROUTER] = OpenRouterProvider(
+            self.providers.register(LLMProvider.OPENROUTER, partial(
+                OpenRouterProvider,
                 api_key=config["openrouter"]["api_key"],
                 model=config["openrouter"].get(
                     "model", "openai/gpt-4o-mini"
                 ),
                 alternate_models=config["openrouter"].get("alternate_models", []),
-            )
-            logger.info("Initialized OpenRouter provider with OpenRouter models")
+            ))
+            logger.info("Configured OpenRouter provider with OpenRouter models")
 
         # Set primary and fallback providers
         primary_name = config.get("primary", "openai")
@@ -145,6 +184,7 @@ class LLMManager:
         require_content: bool = False,
         require_tool_calls: bool = False,
         tool_choice: Optional[Any] = None,
+        cache_prefix: bool = False,
     ) -> Dict[str, Any]:
         """
         Generate completion with automatic fallback on failure.
@@ -158,6 +198,8 @@ class LLMManager:
             require_content: If True, treat empty text responses as failures
             require_tool_calls: Require tool calls when tools are provided
             tool_choice: Optional explicit tool selection (e.g., force a function)
+            cache_prefix: Mark the leading system prompt and tools as a stable,
+                cacheable prefix (for agents that resend them every iteration)
 
         Returns:
             Dict containing:
@@ -213,6 +255,7 @@ class LLMManager:
                     temperature,
                     max_tokens,
                     tool_choice,
+                    cache_prefix,
                 )
                 if require_content and not (result.get("content") or "").strip():
                     raise ValueError(f"{provider_type.value} returned empty content")
@@ -263,6 +306,29 @@ class LLMManager:
         print(f"❌ {error_msg}")
         raise Exception(error_msg)
 
+    async def complete_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        use_batch: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run many independent completions.
+
+        Args:
+            requests: complete() keyword arguments, one dict per request
+            use_batch: Submit through the primary provider's batch API
+                (cheaper, but may take hours) when it has one; otherwise
+                the requests run concurrently through complete()
+
+        Returns:
+            One result per request, in order
+        """
+        if use_batch:
+            provider = self.providers[self.primary_provider]
+            if hasattr(provider, "complete_batch"):
+                return await provider.complete_batch(requests)
+        return await asyncio.gather(*(self.complete(**request) for request in requests))
+
     async def _execute_provider_call(
         self,
         provider_type: LLMProvider,
@@ -271,11 +337,14 @@ class LLMManager:
         temperature: float,
         max_tokens: int,
         tool_choice: Optional[Any],
+        cache_prefix: bool = False,
     ) -> Dict[str, Any]:
         provider = self.providers[provider_type]
         logger.info("Attempting completion with provider: %s", provider_type.value)
+        # Only forward the caching hint when set so minimal providers keep working
+        extra: Dict[str, Any] = {"cache_prefix": True} if cache_prefix else {}
         result = await provider.complete(
-            messages, tools, temperature, max_tokens, tool_choice=tool_choice
+            messages, tools, temperature, max_tokens, tool_choice=tool_choice, **extra
         )
         return result
 
@@ -341,6 +410,33 @@ class LLMManager:
             return len(text) // 4
         return self.providers[provider_type].count_tokens(text)
 
+    async def warmup(self, texts: Optional[List[str]] = None) -> None:
+        """
+        Prime the primary provider's connection and token counts.
+
+        Meant to run as a background task (e.g. while research is underway)
+        so the first evaluator call does not pay for connection setup or
+        tokenizing its static prompt. Only the primary provider is built, so
+        fallbacks stay lazy. Never raises.
+
+        Args:
+            texts: Prompt texts to pre-count with the primary provider
+        """
+        if self.primary_provider not in self.providers:
+            return
+
+        try:
+            await self.providers[self.primary_provider].warmup()
+        except Exception as e:
+            logger.debug(f"Warmup failed for {self.primary_provider.value}: {e}")
+
+        for text in texts or []:
+            try:
+                # Tokenizing is CPU-bound; keep it off the event loop
+                await asyncio.to_thread(self.count_tokens, text)
+            except Exception as e:
+                logger.debug(f"Warmup token count failed: {e}")
+
     def estimate_cost(
         self,
         input_tokens: int,
@@ -4,18 +4,141 @@ OpenAI Provider
 Implements the BaseLLMProvider interface for OpenAI's API.
 """
 
+import asyncio
+import hashlib
+import inspect
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import tiktoken
-from openai import AsyncOpenAI, BadRequestError
+from openai import (
+    AsyncOpenAI,
+    BadRequestError,
+    DefaultAioHttpClient,
+    DefaultAsyncHttpxClient,
+)
+from openai.types.chat import ChatCompletion
+from openai.types.responses import Response
 
 from .base import BaseLLMProvider
+from .http_client import LLM_HTTP_LIMITS, pooled_client_kwargs
+
+# Optional: orjson encodes request bodies several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Pre-encoded bodies go through post(content=...), which older SDKs lack
+_PREENCODED_BODIES = (
+    ORJSON_AVAILABLE and "content" in inspect.signature(AsyncOpenAI.post).parameters
+)
+
+# Batch API polling: start short, back off to at most a minute between checks
+BATCH_POLL_INITIAL_SECONDS = 5.0
+BATCH_POLL_MAX_SECONDS = 60.0
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _build_http_client():
+    """
+    Pooled HTTP client for AsyncOpenAI.
+
+    Prefers the SDK's aiohttp transport (installed via ``openai[aiohttp]``),
+    which holds up better under many concurrent completions, and falls back
+    to the default httpx transport otherwise. Only the pool limits apply to
+    aiohttp; ``http2`` is an httpx transport option.
+    """
+    try:
+        return DefaultAioHttpClient(limits=LLM_HTTP_LIMITS)
+    except RuntimeError:
+        return DefaultAsyncHttpxClient(**pooled_client_kwargs())
+
+
+# Pooled client shared by every OpenAIProvider that LLMManager builds, so
+# per-request managers do not each open their own connection pool. Its
+# connections belong to the event loop it was created on.
+_shared_http_client = None
+_shared_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_http_client():
+    """
+    Get the HTTP client shared by LLMManager-built OpenAI providers.
+
+    A new client is built when the previous one was closed or belongs to a
+    different event loop (e.g. a later ``asyncio.run``).
+
+    Returns:
+        Pooled HTTP client, created on first use
+    """
+    global _shared_http_client, _shared_http_client_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if (
+        _shared_http_client is None
+        or _shared_http_client.is_closed
+        or _shared_http_client_loop is not loop
+    ):
+        _shared_http_client = _build_http_client()
+        _shared_http_client_loop = loop
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared OpenAI HTTP client (call on application shutdown)."""
+    global _shared_http_client, _shared_http_client_loop
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+        _shared_http_client_loop = None
+
+
+def _tool_call(call_id: str, name: str, arguments: str) -> Dict[str, Any]:
+    """
+    Build a tool call in the chat-completions shape.
+
+    This dict is the contract shared by all providers: agents resend it in
+    the message history and it is stored with trace events as JSON.
+    """
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {"name": name, "arguments": arguments},
+    }
+
+
+# Model-name prefixes served through the Responses API (temperature pinned
+# to 1.0, reasoning effort); everything else uses Chat Completions
+_RESPONSES_API_FAMILIES = ("gpt-5",)
+
+
+@lru_cache(maxsize=32)
+def _needs_responses_api(model: str) -> bool:
+    """Whether ``model`` belongs to a family routed to the Responses API."""
+    return model.startswith(_RESPONSES_API_FAMILIES)
+
+
+@lru_cache(maxsize=4096)
+def _count_tokens(encoding_name: str, text: str) -> int:
+    """
+    Token count memoised per (encoding, text).
+
+    Shared by every provider instance, so the static prompts that
+    LLMManager.warmup pre-counts for each research session are tokenized
+    once per process rather than once per session.
+    """
+    return len(tiktoken.get_encoding(encoding_name).encode(text))
+
 
 class OpenAIProvider(BaseLLMProvider):
     """
@@ -54,6 +177,7 @@ class OpenAIProvider(BaseLLMProvider):
         max_tokens: Optional[int] = None,
         max_completion_tokens: Optional[int] = None,
         reasoning_effort: Optional[str] = None,
+        http_client: Optional[Any] = None,
     ):
         """
         Initialize OpenAI provider.
@@ -65,15 +189,35 @@ class OpenAIProvider(BaseLLMProvider):
             max_tokens: Legacy max token budget
             max_completion_tokens: Responses API max token budget
             reasoning_effort: Optional reasoning effort override
+            http_client: Shared HTTP client to use; the provider builds (and
+                owns) its own when omitted
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self._owns_http_client = http_client is None
+        self.client = AsyncOpenAI(
+            api_key=api_key, http_client=http_client or _build_http_client()
+        )
+        # Last (messages, Responses input items, call-id map) converted
+        self._responses_input_cache: Optional[
+            Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, str]]
+        ] = None
+        # Last (chat tool list, converted Responses tools); agents pass the
+        # same list on every call
+        self._responses_tools_cache: Optional[
+            Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+        ] = None
         self.model = model
-        self.is_gpt5 = model.startswith("gpt-5")
+        self.is_gpt5 = _needs_responses_api(model)
         self.default_temperature = (
             1.0 if self.is_gpt5 else (temperature if temperature is not None else 0.7)
         )
         self.default_max_tokens = max_tokens
         self.default_max_completion_tokens = max_completion_tokens
+        # Chat Completions token budget: the caller's value, else the default
+        default_budget = self.default_max_tokens
+        if default_budget:
+            self._resolve_budget = lambda max_tokens: max_tokens or default_budget
+        else:
+            self._resolve_budget = lambda max_tokens: max_tokens
         if self.is_gpt5:
             self.reasoning_effort = reasoning_effort or "low"
         else:
@@ -95,6 +239,12 @@ class OpenAIProvider(BaseLLMProvider):
                     "Model %s not found in tiktoken, using cl100k_base fallback", model
                 )
 
+        # The API family is fixed per model, so pick the path once instead of
+        # branching on every call
+        self.complete = (
+            self._complete_responses_api if self.is_gpt5 else self._complete_chat_completions
+        )
+
         logger.info(f"Initialized OpenAI provider with model: {model}")
 
     async def complete(
@@ -104,6 +254,7 @@ class OpenAIProvider(BaseLLMProvider):
         temperature: float = 0.7,
         max_tokens: int = 2000,
         tool_choice: Optional[Any] = None,
+        cache_prefix: bool = False,
     ) -> Dict[str, Any]:
         """
         Generate completion using OpenAI API.
@@ -113,24 +264,141 @@ class OpenAIProvider(BaseLLMProvider):
             tools: Optional list of tool definitions for function calling
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens to generate
+            cache_prefix: Route requests sharing a system prompt to the same
+                prompt cache via prompt_cache_key
 
         Returns:
             Dict containing completion result and metadata
 
         Raises:
             Exception: If API call fails
+
+        Note:
+            ``__init__`` rebinds ``complete`` on each instance to
+            ``_complete_responses_api`` or ``_complete_chat_completions``;
+            this body only runs when called through the class.
         """
         if self.is_gpt5:
             return await self._complete_responses_api(
-                messages, tools, temperature, max_tokens, tool_choice
+                messages, tools, temperature, max_tokens, tool_choice, cache_prefix
             )
         return await self._complete_chat_completions(
-            messages, tools, temperature, max_tokens, tool_choice
+            messages, tools, temperature, max_tokens, tool_choice, cache_prefix
+        )
+
+    async def complete_batch(
+        self, requests: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run many independent completions through the OpenAI Batch API.
+
+        Batch jobs are billed at half price but may take up to 24h, so this
+        is for offline work (evaluation sweeps, bulk extraction), not the
+        interactive research loop.
+
+        Args:
+            requests: complete() keyword arguments, one dict per request
+                (messages, tools, temperature, max_tokens, tool_choice)
+
+        Returns:
+            One result per request, in order, shaped like complete()'s
+            return value. Requests that failed inside the batch come back
+            as {"error": ..., "model": ..., "provider": "openai"}.
+
+        Raises:
+            Exception: If the batch job itself fails, expires or is cancelled
+        """
+        if not requests:
+            return []
+
+        endpoint = "/v1/responses" if self.is_gpt5 else "/v1/chat/completions"
+        lines = []
+        for index, request in enumerate(requests):
+            if self.is_gpt5:
+                body = self._responses_request_kwargs(
+                    request["messages"],
+                    request.get("tools"),
+                    request.get("temperature", 0.7),
+                    request.get("tool_choice"),
+                )
+            else:
+                body = self._chat_request_kwargs(
+                    request["messages"],
+                    request.get("tools"),
+                    request.get("temperature", 0.7),
+                    request.get("max_tokens", 2000),
+                    request.get("tool_choice"),
+                )
+            lines.append(json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": endpoint,
+                "body": body,
+            }))
+
+        input_file = await self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=endpoint,
+            completion_window="24h",
         )
+        logger.info(f"[OpenAI] Submitted batch {batch.id} with {len(requests)} requests")
+
+        delay = BATCH_POLL_INITIAL_SECONDS
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise Exception(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await self.client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    record = json.loads(line)
+                    results[int(record["custom_id"])] = self._format_batch_record(record)
+
+        return [
+            result or {"error": "missing from batch output", "model": self.model, "provider": "openai"}
+            for result in results
+        ]
+
+    def _format_batch_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize one Batch API output line to complete()'s schema."""
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            error = record.get("error") or response.get("body", {}).get("error")
+            return {"error": str(error), "model": self.model, "provider": "openai"}
+        # Output comes straight from the API, so skip validation; the SDK's
+        # model_construct still builds the nested models, as it does for
+        # live responses
+        if self.is_gpt5:
+            return self._format_responses_response(Response.model_construct(**response["body"]))
+        return self._format_chat_response(ChatCompletion.model_construct(**response["body"]))
+
+    async def warmup(self) -> None:
+        """Open the pooled connection with a cheap model lookup."""
+        try:
+            await self.client.models.retrieve(self.model)
+        except Exception as e:
+            logger.debug(f"[OpenAI] Warmup request failed: {e}")
+
+    async def close(self):
+        """Close the HTTP client unless it is shared."""
+        if self._owns_http_client:
+            await self.client.close()
 
     def count_tokens(self, text: str) -> int:
         """Count tokens using OpenAI's tokenizer."""
-        return len(self.encoding.encode(text))
+        return _count_tokens(self.encoding.name, text)
 
     def get_model_name(self) -> str:
         """Get current model name."""
@@ -151,20 +419,119 @@ class OpenAIProvider(BaseLLMProvider):
         return input_cost + output_cost
 
     async def _complete_chat_completions(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        tool_choice: Optional[Any] = None,
+        cache_prefix: bool = False,
+    ) -> Dict[str, Any]:
+        """Invoke Chat Completions API (GPT-4.x and below)."""
+        cache_key = self._prompt_cache_key(messages) if cache_prefix else None
+        kwargs = self._chat_request_kwargs(
+            messages, tools, temperature, max_tokens, tool_choice, cache_key
+        )
+
+        try:
+            response = await self._send_chat(kwargs)
+        except BadRequestError as e:
+            error_message = str(e)
+            if "max_completion_tokens" in error_message and "max_tokens" in kwargs:
+                logger.info(
+                    "OpenAI model %s requires 'max_completion_tokens'; retrying request",
+                    self.model,
+                )
+                kwargs["max_completion_tokens"] = kwargs.pop("max_tokens")
+                response = await self._send_chat(kwargs)
+            else:
+                logger.error("OpenAI Chat API error: %s", e)
+                raise
+        except Exception as e:
+            logger.error("OpenAI Chat API error: %s", e)
+            raise
+
+        return self._format_chat_response(response)
+
+    async def _complete_responses_api(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        tool_choice: Optional[Any] = None,
+        cache_prefix: bool = False,
+    ) -> Dict[str, Any]:
+        """Invoke Responses API for GPT-5 models with reasoning support."""
+        cache_key = self._prompt_cache_key(messages) if cache_prefix else None
+        kwargs = self._responses_request_kwargs(
+            messages, tools, temperature, tool_choice, cache_key
+        )
+
+        try:
+            response = await self._create(
+                self.client.responses.create, "/responses", Response, kwargs
+            )
+        except Exception as e:
+            logger.error("OpenAI Responses API error: %s", e)
+            raise
+
+        return self._format_responses_response(response)
+
+    async def _send_chat(self, kwargs: Dict[str, Any]) -> Any:
+        """Send one chat.completions request."""
+        return await self._create(
+            self.client.chat.completions.create,
+            "/chat/completions",
+            ChatCompletion,
+            kwargs,
+        )
+
+    async def _create(
+        self,
+        create: Callable[..., Awaitable[Any]],
+        path: str,
+        cast_to: type,
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """
+        Send one request, encoding the body with orjson when available.
+
+        The SDK would otherwise run the (often large) Responses input through
+        json.dumps. Bodies orjson cannot encode go through ``create`` as usual.
+
+        Args:
+            create: Typed SDK method for the endpoint
+            path: Endpoint path for the pre-encoded request
+            cast_to: Response model the SDK parses the reply into
+            kwargs: Request body
+
+        Returns:
+            Parsed SDK response object
+        """
+        if _PREENCODED_BODIES:
+            try:
+                content = orjson.dumps(kwargs)
+            except TypeError:
+                pass
+            else:
+                return await self.client.post(path, content=content, cast_to=cast_to)
+        return await create(**kwargs)
+
+    def _chat_request_kwargs(
         self,
         messages: List[Dict[str, str]],
         tools: Optional[List[Dict[str, Any]]],
         temperature: float,
         max_tokens: int,
         tool_choice: Optional[Any],
+        cache_key: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Invoke Chat Completions API (GPT-4.x and below)."""
+        """Build the chat.completions request body."""
         effective_temperature = (
             temperature if temperature is not None else self.default_temperature
         )
-        token_budget = max_tokens or self.default_max_tokens
-        if self.default_max_tokens and token_budget is None:
-            token_budget = self.default_max_tokens
+        token_budget = self._resolve_budget(max_tokens)
 
         kwargs: Dict[str, Any] = {
             "model": self.model,
@@ -180,36 +547,19 @@ class OpenAIProvider(BaseLLMProvider):
                 kwargs["tool_choice"] = tool_choice
             else:
                 kwargs["tool_choice"] = "auto"
+        if cache_key:
+            kwargs["prompt_cache_key"] = cache_key
+        return kwargs
 
-        try:
-            response = await self.client.chat.completions.create(**kwargs)
-        except BadRequestError as e:
-            error_message = str(e)
-            if "max_completion_tokens" in error_message and "max_tokens" in kwargs:
-                logger.info(
-                    "OpenAI model %s requires 'max_completion_tokens'; retrying request",
-                    self.model,
-                )
-                kwargs["max_completion_tokens"] = kwargs.pop("max_tokens")
-                response = await self.client.chat.completions.create(**kwargs)
-            else:
-                logger.error(f"OpenAI Chat API error: {e}")
-                raise
-        except Exception as e:
-            logger.error(f"OpenAI Chat API error: {e}")
-            raise
-
-        return self._format_chat_response(response)
-
-    async def _complete_responses_api(
+    def _responses_request_kwargs(
         self,
         messages: List[Dict[str, str]],
         tools: Optional[List[Dict[str, Any]]],
         temperature: float,
-        max_tokens: int,
         tool_choice: Optional[Any],
+        cache_key: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Invoke Responses API for GPT-5 models with reasoning support."""
+        """Build the responses.create request body."""
         if temperature is not None and abs(temperature - 1.0) > 1e-6:
             logger.info(
                 "gpt-5 models require temperature=1.0. Overriding requested temperature %.2f -> 1.0",
@@ -227,48 +577,49 @@ class OpenAIProvider(BaseLLMProvider):
             kwargs["tools"] = self._convert_tools_for_responses(tools)
         if tool_choice is not None:
             kwargs["tool_choice"] = self._convert_tool_choice_for_responses(tool_choice)
+        if cache_key:
+            kwargs["prompt_cache_key"] = cache_key
+        return kwargs
 
-        try:
-            response = await self.client.responses.create(**kwargs)
-        except Exception as e:
-            logger.error(f"OpenAI Responses API error: {e}")
-            raise
-
+    def _format_responses_response(self, response: Any) -> Dict[str, Any]:
+        """Normalize a Responses API reply to common schema."""
         content_text, tool_calls = self._parse_responses_output(response)
-        usage = self._parse_responses_usage(response)
-        finish_reason = getattr(response, "status", None) or "completed"
 
         return {
             "content": content_text,
-            "tool_calls": tool_calls or None,
-            "finish_reason": finish_reason,
-            "usage": usage,
+            "tool_calls": tool_calls,  # Already None when there are no calls
+            "finish_reason": getattr(response, "status", None) or "completed",
+            "usage": self._parse_responses_usage(response),
             "model": self.model,
             "provider": "openai",
         }
 
+    def _prompt_cache_key(self, messages: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Derive a prompt_cache_key from the leading system message.
+
+        OpenAI caches stable prompt prefixes automatically; a shared key keeps
+        requests with the same system prompt on the same cache shard.
+        """
+        if not messages or messages[0].get("role") != "system":
+            return None
+        content = self._normalize_message_content(messages[0].get("content"))
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+        return f"{self.model}:{digest}"
+
     def _format_chat_response(self, response: Any) -> Dict[str, Any]:
         """Normalize chat.completions response to common schema."""
-        message = response.choices[0].message
-        content_text = self._normalize_message_content(message.content)
-        tool_calls = None
-        if hasattr(message, "tool_calls") and message.tool_calls:
-            tool_calls = [
-                {
-                    "id": tc.id,
-                    "type": tc.type,
-                    "function": {
-                        "name": tc.function.name,
-                        "arguments": tc.function.arguments,
-                    },
-                }
-                for tc in message.tool_calls
-            ]
+        choice = response.choices[0]
+        message = choice.message
+        tool_calls = [
+            _tool_call(tc.id, tc.function.name, tc.function.arguments)
+            for tc in getattr(message, "tool_calls", None) or ()
+        ]
 
         return {
-            "content": content_text,
-            "tool_calls": tool_calls,
-            "finish_reason": response.choices[0].finish_reason,
+            "content": self._normalize_message_content(message.content),
+            "tool_calls": tool_calls or None,
+            "finish_reason": choice.finish_reason,
             "usage": {
                 "input_tokens": response.usage.prompt_tokens,
                 "output_tokens": response.usage.completion_tokens,
@@ -285,15 +636,18 @@ class OpenAIProvider(BaseLLMProvider):
         if isinstance(content, str):
             return content
         if isinstance(content, list):
+            # Keep only non-empty text so the join needs no second filter pass
             parts = []
             for item in content:
-                if isinstance(item, dict) and item.get("type") == "text":
-                    parts.append(item.get("text", ""))
-                elif isinstance(item, dict) and "text" in item:
-                    parts.append(item["text"])
+                if isinstance(item, dict):
+                    text = item.get("text")
                 elif isinstance(item, str):
-                    parts.append(item)
-            return "\n".join(part for part in parts if part)
+                    text = item
+                else:
+                    continue
+                if text:
+                    parts.append(text)
+            return "\n".join(parts)
         return str(content)
 
     def _to_responses_input(
@@ -302,12 +656,49 @@ class OpenAIProvider(BaseLLMProvider):
         """
         Convert Chat Completions history into Responses API input items.
 
-        Returns Inputs containing message history using
-        `input_text` / `output_text` parts and function_call_output items for tools.
-        This aligns with Responses API schema (no top-level tool_outputs).
+        Agents resend the same, append-only history every iteration, so the
+        last conversion is kept and only messages added since are converted.
+        The prefix check is by identity; a history that was edited or
+        replaced is converted from scratch.
+        """
+        cached = self._responses_input_cache
+        if (
+            cached is not None
+            and len(cached[0]) <= len(messages)
+            and all(seen is msg for seen, msg in zip(cached[0], messages))
+        ):
+            seen, items, cached_call_ids = cached
+            # Copy: earlier requests may still hold the cached lists
+            start, inputs, call_id_map = len(seen), list(items), dict(cached_call_ids)
+        else:
+            start, inputs, call_id_map = 0, [], {}
+
+        self._extend_responses_input(messages[start:], inputs, call_id_map)
+        self._responses_input_cache = (list(messages), inputs, call_id_map)
+        return inputs
+
+    def _extend_responses_input(
+        self,
+        messages: List[Dict[str, Any]],
+        inputs: List[Dict[str, Any]],
+        call_id_map: Dict[str, str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Append Responses API input items for messages to inputs.
+
+        Produces message history using `input_text` / `output_text` parts and
+        function_call_output items for tools. This aligns with Responses API
+        schema (no top-level tool_outputs).
+
+        Args:
+            messages: Chat-format messages to convert
+            inputs: Items converted so far (extended in place)
+            call_id_map: Maps original tool call IDs to normalized IDs
+                (updated in place)
+
+        Returns:
+            inputs
         """
-        inputs: List[Dict[str, Any]] = []
-        call_id_map: Dict[str, str] = {}  # Maps original IDs to normalized IDs
 
         for msg in messages:
             role = msg.get("role", "user")
@@ -400,59 +791,30 @@ class OpenAIProvider(BaseLLMProvider):
         text_chunks: List[str] = []
         tool_calls: List[Dict[str, Any]] = []
 
-        outputs = getattr(response, "output", []) or []
-        for item in outputs:
-            item_type = getattr(item, "type", None) or (item.get("type") if isinstance(item, dict) else None)
-
-            if item_type == "message":
-                content_items = getattr(item, "content", None) or (item.get("content") if isinstance(item, dict) else [])
-                for part in content_items or []:
-                    part_type = getattr(part, "type", None) or (part.get("type") if isinstance(part, dict) else None)
-                    if part_type == "output_text":
-                        text_val = getattr(part, "text", None) or (part.get("text") if isinstance(part, dict) else None)
-                        if text_val:
-                            text_chunks.append(text_val)
-                    elif part_type in {"tool_call", "function_call"}:
-                        part_data = part if isinstance(part, dict) else {}
-                        arguments = part_data.get("arguments") or "{}"
-                        if not isinstance(arguments, str):
-                            try:
-                                arguments = json.dumps(arguments)
-                            except Exception:
-                                arguments = str(arguments)
-                        tool_calls.append(
-                            {
-                                "id": part_data.get("id") or part_data.get("call_id") or "function_call",
-                                "type": "function",
-                                "function": {
-                                    "name": part_data.get("name"),
-                                    "arguments": arguments,
-                                },
-                            }
-                        )
-            elif item_type == "function_call":
-                name = getattr(item, "name", None) or (item.get("name") if isinstance(item, dict) else None)
-                arguments = getattr(item, "arguments", None) or (item.get("arguments") if isinstance(item, dict) else None)
-                call_id = getattr(item, "id", None) or getattr(item, "call_id", None)
-                if isinstance(item, dict):
-                    call_id = call_id or item.get("id") or item.get("call_id")
-                if isinstance(arguments, (dict, list)):
-                    try:
+        for item in response.output or []:
+            try:
+                item_type = item.type
+                if item_type == "message":
+                    for part in item.content:
+                        if part.type == "output_text" and part.text:
+                            text_chunks.append(part.text)
+                elif item_type == "function_call":
+                    arguments = item.arguments
+                    if isinstance(arguments, (dict, list)):
                         arguments = json.dumps(arguments)
-                    except Exception:
-                        arguments = str(arguments)
-                tool_calls.append(
-                    {
-                        "id": call_id or name or "function_call",
-                        "type": "function",
-                        "function": {"name": name, "arguments": arguments or "{}"},
-                    }
-                )
+                    tool_calls.append(_tool_call(
+                        item.id or item.call_id or item.name or "function_call",
+                        item.name,
+                        arguments or "{}",
+                    ))
+            except AttributeError:
+                # Unexpected item shape (e.g. a new output type); skip it
+                continue
 
-        if not text_chunks and getattr(response, "output_text", None):
-            text_chunks.append(getattr(response, "output_text"))
+        if not text_chunks and response.output_text:
+            text_chunks.append(response.output_text)
 
-        content_text = "\n".join(chunk for chunk in text_chunks if chunk)
+        content_text = "\n".join(text_chunks)
         return content_text, tool_calls or None
 
     def _convert_tools_for_responses(
@@ -460,7 +822,14 @@ class OpenAIProvider(BaseLLMProvider):
     ) -> List[Dict[str, Any]]:
         """
         Convert OpenAI Chat tool defs ({'function': {...}}) to Responses function tools.
+
+        The result for the last list seen is reused when the caller passes the
+        same list object again.
         """
+        cached = self._responses_tools_cache
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+
         converted: List[Dict[str, Any]] = []
         for tool in tools:
             func = tool.get("function", {}) or {}
@@ -472,6 +841,7 @@ class OpenAIProvider(BaseLLMProvider):
                     "parameters": func.get("parameters"),
                 }
             )
+        self._responses_tools_cache = (tools, converted)
         return converted
 
     def _convert_tool_choice_for_responses(self, tool_choice: Any) -> Any:
@@ -11,6 +11,7 @@ from typing import Dict, Any, List, Optional, Union, Set
 import httpx
 
 from .base import BaseLLMProvider
+from .http_client import pooled_client_kwargs
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,10 @@ class OpenRouterProvider(BaseLLMProvider):
         "openai/gpt-oss-120b": {"input": 1.20, "output": 1.20},
     }
 
+    # Upstreams that only cache prompts marked with cache_control; others
+    # routed through OpenRouter cache stable prefixes automatically
+    CACHE_CONTROL_PREFIXES = ("anthropic/", "google/")
+
     # Recommended tool-capable models (small → mid → large)
     DEFAULT_MODEL_PRIORITY = [
         "openai/gpt-oss-safeguard-20b",
@@ -61,11 +66,24 @@ class OpenRouterProvider(BaseLLMProvider):
             raise ValueError("OpenRouter provider requires at least one model")
         self.current_model = self.model_priority[0]
         self.base_url = "https://openrouter.ai/api/v1"
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.client = httpx.AsyncClient(timeout=60.0, **pooled_client_kwargs())
+        self._completions_url = f"{self.base_url}/chat/completions"
+        # Identical for every request, so built once
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "HTTP-Referer": "https://agentic-research-lab.com",
+            "X-Title": "Agentic Research Lab",
+            "Content-Type": "application/json",
+        }
         self.model_failures: Dict[str, int] = {}
         self.model_cooldowns: Dict[str, datetime] = {}
         self.tool_incompatible_models: Set[str] = set()
+        # Per-model circuit breaker: open after model_failure_threshold
+        # consecutive failures, stay open for model_backoff_seconds, then let
+        # a single probe request through (half-open)
+        self.model_failure_threshold = 2
         self.model_backoff_seconds = 300
+        self.model_probe_seconds = 60
 
         logger.info(
             "Initialized OpenRouter provider with models: %s",
@@ -79,6 +97,7 @@ class OpenRouterProvider(BaseLLMProvider):
         temperature: float = 0.7,
         max_tokens: int = 2000,
         tool_choice: Optional[Any] = None,
+        cache_prefix: bool = False,
     ) -> Dict[str, Any]:
         """
         Generate completion using OpenRouter API.
@@ -88,6 +107,8 @@ class OpenRouterProvider(BaseLLMProvider):
             tools: Optional list of tool definitions for function calling
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens to generate
+            cache_prefix: Add a cache_control breakpoint to the system prompt
+                for upstreams that need explicit markers (Anthropic, Gemini)
 
         Returns:
             Dict containing completion result and metadata
@@ -95,13 +116,6 @@ class OpenRouterProvider(BaseLLMProvider):
         Raises:
             Exception: If API call fails
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "HTTP-Referer": "https://agentic-research-lab.com",
-            "X-Title": "Agentic Research Lab",
-            "Content-Type": "application/json",
-        }
-
         last_error: Optional[Exception] = None
 
         for model_name in self.model_priority:
@@ -121,7 +135,11 @@ class OpenRouterProvider(BaseLLMProvider):
                 continue
             payload = {
                 "model": model_name,
-                "messages": messages,
+                "messages": (
+                    self._with_cache_control(messages)
+                    if cache_prefix and model_name.startswith(self.CACHE_CONTROL_PREFIXES)
+                    else messages
+                ),
                 "temperature": temperature,
                 "max_tokens": max_tokens,
             }
@@ -134,13 +152,7 @@ class OpenRouterProvider(BaseLLMProvider):
                     payload["tool_choice"] = "auto"
 
             try:
-                response = await self.client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                data = response.json()
+                data = await self._post_once(payload)
             except httpx.HTTPStatusError as e:
                 status = e.response.status_code if e.response else "unknown"
                 detail = e.response.text if e.response is not None else str(e)
@@ -271,6 +283,55 @@ class OpenRouterProvider(BaseLLMProvider):
         output_cost = (output_tokens / 1_000_000) * pricing["output"]
         return input_cost + output_cost
 
+    async def _post_once(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one chat completion request over the pooled client.
+
+        Args:
+            payload: Request body for /chat/completions
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            httpx.HTTPStatusError: On a non-2xx response
+        """
+        response = await self.client.post(
+            self._completions_url,
+            headers=self._headers,
+            json=payload,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _with_cache_control(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return messages with an ephemeral cache breakpoint on the system prompt.
+
+        The original list is not modified.
+        """
+        if not messages or messages[0].get("role") != "system":
+            return messages
+        system = dict(messages[0])
+        system["content"] = [
+            {
+                "type": "text",
+                "text": self._normalize_message_content(system.get("content")),
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        return [system, *messages[1:]]
+
+    async def warmup(self) -> None:
+        """Open the pooled connection with a cheap models listing."""
+        try:
+            await self.client.get(
+                f"{self.base_url}/models",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+        except Exception as e:
+            logger.debug("[OpenRouter] Warmup request failed: %s", e)
+
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
@@ -284,26 +345,34 @@ class OpenRouterProvider(BaseLLMProvider):
         if isinstance(content, str):
             return content
         if isinstance(content, list):
+            # Keep only non-empty text so the join needs no second filter pass
             parts = []
             for item in content:
-                if isinstance(item, dict) and item.get("type") == "text":
-                    parts.append(item.get("text", ""))
-                elif isinstance(item, dict) and "text" in item:
-                    parts.append(item["text"])
+                if isinstance(item, dict):
+                    text = item.get("text")
                 elif isinstance(item, str):
-                    parts.append(item)
-            return "\n".join(part for part in parts if part)
+                    text = item
+                else:
+                    continue
+                if text:
+                    parts.append(text)
+            return "\n".join(parts)
         if isinstance(content, dict) and "text" in content:
             return content.get("text", "")
         return str(content)
 
     def _is_model_available(self, model_name: str) -> bool:
         cooldown_until = self.model_cooldowns.get(model_name)
-        if cooldown_until:
-            if datetime.utcnow() >= cooldown_until:
-                del self.model_cooldowns[model_name]
-                return True
+        if cooldown_until is None:
+            return True
+        now = datetime.utcnow()
+        if now < cooldown_until:
             return False
+        # Half-open: this caller probes the model; concurrent callers keep
+        # skipping it until the probe succeeds (reset) or fails (re-open)
+        self.model_cooldowns[model_name] = now + timedelta(
+            seconds=self.model_probe_seconds
+        )
         return True
 
     def _register_model_failure(
@@ -311,7 +380,7 @@ class OpenRouterProvider(BaseLLMProvider):
     ) -> None:
         count = self.model_failures.get(model_name, 0) + 1
         self.model_failures[model_name] = count
-        if count < 2:
+        if count < self.model_failure_threshold:
             return
         cooldown_until = datetime.utcnow() + timedelta(
             seconds=self.model_backoff_seconds
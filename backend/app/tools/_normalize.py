@@ -0,0 +1,88 @@
+"""
+Search Result Normalization
+
+Converts raw provider search results into the common web_search result
+format. Kept free of dynamic features and fully annotated so the module can
+be compiled (e.g. with mypyc) without changes; the pure-Python version is
+used whenever no compiled artifact is present.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+@lru_cache(maxsize=4096)
+def url_parts(url: str) -> Tuple[str, bool]:
+    """
+    Split a result URL into its domain and PDF flag with a single parse.
+
+    Mirrors ``extract_domain`` (falls back to "unknown") but avoids parsing
+    the same URL twice when both the domain and ``is_pdf`` are needed.
+
+    Args:
+        url: Result URL
+
+    Returns:
+        Tuple of (domain, is_pdf)
+    """
+    try:
+        domain = urlsplit(url).netloc or "unknown"
+    except Exception:
+        domain = "unknown"
+    return domain, url.lower().endswith(".pdf")
+
+
+def normalize_results(
+    raw_results: List[Dict[str, Any]],
+    field_map: Dict[str, str],
+    num_results: int,
+    max_snippet_chars: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Normalize provider results to the common web_search result format.
+
+    Args:
+        raw_results: Result items as returned by the provider
+        field_map: Normalized field -> provider field ('title', 'snippet',
+            'url', optionally 'relevance_score' and 'date_published')
+        num_results: Maximum number of results to keep
+        max_snippet_chars: Optional snippet truncation length
+
+    Returns:
+        List of normalized search results
+    """
+    title_key = field_map["title"]
+    snippet_key = field_map["snippet"]
+    url_key = field_map["url"]
+    score_key = field_map.get("relevance_score")
+    date_key = field_map.get("date_published")
+
+    results: List[Dict[str, Any]] = []
+    for idx, result in enumerate(raw_results[:num_results]):
+        snippet = result.get(snippet_key, "")
+        if max_snippet_chars and len(snippet) > max_snippet_chars:
+            snippet = snippet[: max_snippet_chars - 3] + "..."
+
+        url = result.get(url_key, "")
+        domain, is_pdf = url_parts(url)
+        positional_score = 1.0 - (idx * 0.05)
+        normalized_result: Dict[str, Any] = {
+            "title": result.get(title_key, ""),
+            "snippet": snippet,
+            "url": url,
+            "domain": domain,
+            "is_pdf": is_pdf,
+            "relevance_score": (
+                result.get(score_key, positional_score) if score_key else positional_score
+            ),
+            "content_type": "web_page",
+        }
+
+        # Add published date if available
+        if date_key and result.get(date_key):
+            normalized_result["date_published"] = result[date_key]
+
+        results.append(normalized_result)
+
+    return results
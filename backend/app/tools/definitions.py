@@ -4,7 +4,8 @@ Tool Definitions
 OpenAI-compatible function definitions for all research tools.
 """
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 
 
 WEB_SEARCH_DEFINITION = {
@@ -32,9 +33,10 @@ WEB_SEARCH_DEFINITION = {
                 },
                 "date_filter": {
                     "type": "string",
-                    "enum": ["day", "week", "month", "year", None],
+                    "enum": ["day", "week", "month", "year"],
                     "description": (
-                        "Filter by recency. Use for time-sensitive queries."
+                        "Filter by recency. Use for time-sensitive queries; "
+                        "omit for no date filter."
                     ),
                     "default": None,
                 },
@@ -211,17 +213,21 @@ FINISH_DEFINITION = {
 }
 
 
-def get_all_tool_definitions() -> List[Dict[str, Any]]:
+@lru_cache(maxsize=1)
+def get_all_tool_definitions() -> Tuple[Dict[str, Any], ...]:
     """
     Get all tool definitions for agent.
 
+    The same immutable tuple is returned on every call. The definition dicts
+    are shared module constants; treat them as read-only.
+
     Returns:
-        List of OpenAI-compatible tool definitions
+        Tuple of OpenAI-compatible tool definitions
     """
-    return [
+    return (
         WEB_SEARCH_DEFINITION,
         ARXIV_SEARCH_DEFINITION,
         GITHUB_SEARCH_DEFINITION,
         PDF_TO_TEXT_DEFINITION,
         FINISH_DEFINITION,
-    ]
+    )
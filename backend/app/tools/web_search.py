@@ -18,29 +18,56 @@ import logging
 import os
 import asyncio
 import httpx
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 
-# Import Tavily (conditional - graceful degradation if not installed)
-try:
-    from tavily import AsyncTavilyClient
-    TAVILY_AVAILABLE = True
-except ImportError:
-    TAVILY_AVAILABLE = False
-    AsyncTavilyClient = None
-
-from ..utils.text import extract_domain
+from ._normalize import normalize_results
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# Log Tavily availability at module load time
-if not TAVILY_AVAILABLE:
-    logger.warning(
-        "tavily-python not installed. Tavily search will be unavailable. "
-        "Install with: pip install tavily-python"
-    )
+# Default total budget for one search across all providers; matches the
+# tools.web_search_timeout_seconds default (callers pass the configured value)
+DEFAULT_SEARCH_BUDGET_SECONDS = 90.0
+
+# Shared HTTP client reused across searches (created lazily on first use),
+# and the event loop its connections belong to
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client used by all search providers.
+
+    Reusing one client keeps connections (and TLS sessions) alive between
+    searches instead of paying a fresh handshake per provider call. A new
+    client is built when the previous one was closed or belongs to another
+    event loop (e.g. a later ``asyncio.run``).
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _http_client, _http_client_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(timeout=30.0)
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_web_search_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
 
 
 # ============================================================
@@ -52,6 +79,10 @@ async def web_search(
     num_results: int = 10,
     date_filter: Optional[str] = None,
     content_pipeline=None,
+    overall_timeout: float = DEFAULT_SEARCH_BUDGET_SECONDS,
+    speculative: bool = False,
+    hedge: bool = False,
+    hedge_delay: float = 0.8,
     **kwargs  # Catch legacy parameters for backward compatibility
 ) -> Dict[str, Any]:
     """
@@ -67,6 +98,15 @@ async def web_search(
         num_results: Number of results to return (1-20)
         date_filter: Time filter ('day', 'week', 'month', 'year', or None)
         content_pipeline: Optional content pipeline for processing results
+        overall_timeout: Total time budget in seconds shared by all provider
+            attempts; once exhausted, remaining providers are not tried
+        speculative: Query all configured providers concurrently and use the
+            first non-empty result (faster failover, but every provider is
+            billed for every search)
+        hedge: Start providers in priority order, but launch the next one
+            early when the current ones fail or have not answered within
+            hedge_delay seconds; the first non-empty result wins
+        hedge_delay: Seconds to wait on in-flight providers before hedging
         **kwargs: Legacy parameters (ignored with warning)
 
     Returns:
@@ -86,9 +126,6 @@ async def web_search(
         >>> for item in result['results']:
         ...     print(f"- {item['title']}: {item['url']}")
     """
-    # Ensure .env is loaded
-    load_dotenv(override=False)
-
     # Log warning for legacy parameters
     if "provider" in kwargs or "serpapi_key" in kwargs:
         logger.warning(
@@ -105,73 +142,23 @@ async def web_search(
         f"num_results={num_results}, date_filter={date_filter}"
     )
 
-    # Define provider chain with their API keys from environment
-    providers = [
-        ("tavily", os.getenv("TAVILY_API_KEY")),
-        ("serper", os.getenv("SERPER_API_KEY")),
-        ("serpapi", os.getenv("SERPAPI_API_KEY")),
-    ]
-
-    provider_status = {
-        name: ("configured" if api_key else "missing_api_key")
-        for name, api_key in providers
-    }
-    logger.info("[WebSearch] Provider availability: %s", provider_status)
-
-    raw_results = None
-    provider_used = None
-    last_error = None
-    attempts = 0
-
-    # Try each provider in sequence until one succeeds
-    for provider_name, api_key in providers:
-        attempts += 1
-
-        # Skip provider if API key not configured
-        if not api_key:
-            logger.info(f"[WebSearch] Skipping {provider_name}: API key not configured")
-            continue
-
-        try:
-            logger.info(
-                "[WebSearch] Attempt %s/%s using provider='%s'",
-                attempts,
-                len(providers),
-                provider_name,
-            )
-            logger.info(f"[WebSearch] Attempting provider: {provider_name}")
-
-            # Route to appropriate provider implementation
-            if provider_name == "tavily":
-                raw_results = await _search_tavily(query, num_results, date_filter, api_key)
-            elif provider_name == "serper":
-                raw_results = await _search_serper(query, num_results, date_filter, api_key)
-            elif provider_name == "serpapi":
-                raw_results = await _search_serpapi(query, num_results, date_filter, api_key)
-
-            # Check if results are valid (non-empty or explicitly successful)
-            if raw_results and len(raw_results) > 0:
-                provider_used = provider_name
-                logger.info(
-                    f"[WebSearch] ✓ Success with {provider_name}: "
-                    f"{len(raw_results)} results retrieved"
-                )
-                break
-            else:
-                # Empty results - treat as soft failure, try next provider
-                logger.warning(
-                    f"[WebSearch] {provider_name} returned empty results, "
-                    f"trying next provider..."
-                )
-                last_error = Exception(f"{provider_name} returned no results")
+    # Provider chain restricted to providers with configured API keys
+    providers = _get_active_providers()
+    search_functions = _provider_search_functions()
 
-        except Exception as e:
-            last_error = e
-            logger.warning(
-                f"[WebSearch] {provider_name} failed: {type(e).__name__}: {str(e)}"
-            )
-            # Continue to next provider
-            continue
+    if speculative and len(providers) > 1:
+        raw_results, provider_used, last_error, attempts = await _search_speculative(
+            providers, search_functions, query, num_results, date_filter, overall_timeout
+        )
+    elif hedge and len(providers) > 1:
+        raw_results, provider_used, last_error, attempts = await _search_hedged(
+            providers, search_functions, query, num_results, date_filter,
+            overall_timeout, hedge_delay,
+        )
+    else:
+        raw_results, provider_used, last_error, attempts = await _search_sequential(
+            providers, search_functions, query, num_results, date_filter, overall_timeout
+        )
 
     # All providers failed or returned empty results
     if not raw_results or len(raw_results) == 0:
@@ -259,117 +246,510 @@ async def web_search(
     return response
 
 
-# ============================================================
-# PROVIDER IMPLEMENTATIONS
-# ============================================================
-
-async def _search_tavily(
+async def _search_sequential(
+    providers: Tuple[Tuple[str, str], ...],
+    search_functions: Dict[str, Callable[..., Awaitable[List[Dict[str, Any]]]]],
     query: str,
     num_results: int,
-    date_filter: Optional[str] = None,
-    api_key: str = "",
-) -> List[Dict[str, Any]]:
+    date_filter: Optional[str],
+    overall_timeout: float,
+) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str], Optional[Exception], int]:
     """
-    Search using Tavily API (AI-optimized search).
+    Try providers one at a time in priority order until one returns results.
 
-    Tavily provides search results specifically optimized for LLM/AI applications
-    with built-in relevance scoring and content extraction.
+    Returns:
+        Tuple of (raw_results, provider_used, last_error, attempts)
+    """
+    raw_results = None
+    provider_used = None
+    last_error = None
+    attempts = 0
 
-    Args:
-        query: Search query
-        num_results: Number of results (1-20, Tavily supports up to 20)
-        date_filter: Time filter ('day', 'week', 'month', 'year')
-        api_key: Tavily API key
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + overall_timeout
+
+    # Try each provider in sequence until one succeeds
+    for provider_name, api_key in providers:
+        remaining_budget = deadline - loop.time()
+        if remaining_budget <= 0:
+            logger.warning(
+                "[WebSearch] Search budget of %.1fs exhausted; skipping %s",
+                overall_timeout,
+                provider_name,
+            )
+            last_error = TimeoutError(
+                f"search budget of {overall_timeout:.1f}s exhausted"
+            )
+            break
+
+        attempts += 1
+
+        try:
+            logger.info(
+                "[WebSearch] Attempt %s/%s using provider='%s'",
+                attempts,
+                len(providers),
+                provider_name,
+            )
+            logger.info(f"[WebSearch] Attempting provider: {provider_name}")
+
+            # Route to appropriate provider implementation
+            async with asyncio.timeout(remaining_budget):
+                raw_results = await search_functions[provider_name](
+                    query, num_results, date_filter, api_key
+                )
+
+            # Check if results are valid (non-empty or explicitly successful)
+            if raw_results and len(raw_results) > 0:
+                provider_used = provider_name
+                logger.info(
+                    f"[WebSearch] ✓ Success with {provider_name}: "
+                    f"{len(raw_results)} results retrieved"
+                )
+                break
+            else:
+                # Empty results - treat as soft failure, try next provider
+                logger.warning(
+                    f"[WebSearch] {provider_name} returned empty results, "
+                    f"trying next provider..."
+                )
+                last_error = Exception(f"{provider_name} returned no results")
+
+        except TimeoutError:
+            raw_results = None
+            last_error = TimeoutError(
+                f"{provider_name} exceeded the remaining search budget "
+                f"({remaining_budget:.1f}s)"
+            )
+            logger.warning(f"[WebSearch] {last_error}")
+            continue
+        except Exception as e:
+            last_error = e
+            logger.warning(
+                f"[WebSearch] {provider_name} failed: {type(e).__name__}: {str(e)}"
+            )
+            # Continue to next provider
+            continue
+
+    return raw_results, provider_used, last_error, attempts
+
+
+async def _search_speculative(
+    providers: Tuple[Tuple[str, str], ...],
+    search_functions: Dict[str, Callable[..., Awaitable[List[Dict[str, Any]]]]],
+    query: str,
+    num_results: int,
+    date_filter: Optional[str],
+    overall_timeout: float,
+) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str], Optional[Exception], int]:
+    """
+    Query all providers concurrently and keep the first non-empty result.
+
+    Latency on failover becomes that of the fastest successful provider
+    instead of the sum of every failed attempt. When several providers
+    finish together, the higher-priority one wins; the rest are cancelled.
 
     Returns:
-        List of normalized search results
+        Tuple of (raw_results, provider_used, last_error, attempts)
+    """
+    tasks: Dict[asyncio.Task, Tuple[int, str]] = {
+        asyncio.create_task(
+            search_functions[provider_name](query, num_results, date_filter, api_key)
+        ): (index, provider_name)
+        for index, (provider_name, api_key) in enumerate(providers)
+    }
+    logger.info(
+        "[WebSearch] Speculatively querying %s providers: %s",
+        len(tasks),
+        ", ".join(name for name, _ in providers),
+    )
 
-    Raises:
-        ImportError: If tavily-python package not installed
-        Exception: If API request fails (timeout, auth error, rate limit, etc.)
+    pending = set(tasks)
+    last_error: Optional[Exception] = None
+    try:
+        async with asyncio.timeout(overall_timeout):
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=lambda t: tasks[t][0]):
+                    provider_name = tasks[task][1]
+                    try:
+                        raw_results = task.result()
+                    except Exception as e:
+                        last_error = e
+                        logger.warning(
+                            f"[WebSearch] {provider_name} failed: {type(e).__name__}: {str(e)}"
+                        )
+                        continue
+
+                    if raw_results:
+                        logger.info(
+                            f"[WebSearch] ✓ Success with {provider_name}: "
+                            f"{len(raw_results)} results retrieved"
+                        )
+                        return raw_results, provider_name, None, len(tasks)
+
+                    logger.warning(f"[WebSearch] {provider_name} returned empty results")
+                    last_error = Exception(f"{provider_name} returned no results")
+    except TimeoutError:
+        last_error = TimeoutError(f"search budget of {overall_timeout:.1f}s exhausted")
+        logger.warning(f"[WebSearch] {last_error}")
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Let cancelled providers unwind (close their requests) before returning
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    return None, None, last_error, len(tasks)
+
+
+async def _search_hedged(
+    providers: Tuple[Tuple[str, str], ...],
+    search_functions: Dict[str, Callable[..., Awaitable[List[Dict[str, Any]]]]],
+    query: str,
+    num_results: int,
+    date_filter: Optional[str],
+    overall_timeout: float,
+    hedge_delay: float,
+) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str], Optional[Exception], int]:
+    """
+    Query providers in priority order, hedging slow ones with the next provider.
+
+    The next provider is launched as soon as an in-flight one fails, or when
+    none has answered within hedge_delay. The first non-empty result wins
+    (ties go to the higher-priority provider) and the rest are cancelled, so
+    a slow primary costs at most hedge_delay rather than its full timeout.
+
+    Returns:
+        Tuple of (raw_results, provider_used, last_error, attempts)
     """
-    if not TAVILY_AVAILABLE:
-        raise ImportError(
-            "tavily-python package not installed. "
-            "Install with: pip install tavily-python"
+    tasks: Dict[asyncio.Task, Tuple[int, str]] = {}
+    pending: Set[asyncio.Task] = set()
+    last_error: Optional[Exception] = None
+
+    def launch_next() -> None:
+        index = len(tasks)
+        provider_name, api_key = providers[index]
+        logger.info(
+            "[WebSearch] Attempt %s/%s using provider='%s'",
+            index + 1,
+            len(providers),
+            provider_name,
+        )
+        task = asyncio.create_task(
+            search_functions[provider_name](query, num_results, date_filter, api_key)
         )
+        tasks[task] = (index, provider_name)
+        pending.add(task)
+
+    launch_next()
+    try:
+        async with asyncio.timeout(overall_timeout):
+            while pending:
+                can_hedge = len(tasks) < len(providers)
+                done, still_pending = await asyncio.wait(
+                    pending,
+                    timeout=hedge_delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                pending.intersection_update(still_pending)
+
+                if not done:
+                    logger.info(
+                        "[WebSearch] No answer after %.2fs; hedging with next provider",
+                        hedge_delay,
+                    )
+                    launch_next()
+                    continue
+
+                for task in sorted(done, key=lambda t: tasks[t][0]):
+                    provider_name = tasks[task][1]
+                    try:
+                        raw_results = task.result()
+                    except Exception as e:
+                        last_error = e
+                        logger.warning(
+                            f"[WebSearch] {provider_name} failed: {type(e).__name__}: {str(e)}"
+                        )
+                        continue
+
+                    if raw_results:
+                        logger.info(
+                            f"[WebSearch] ✓ Success with {provider_name}: "
+                            f"{len(raw_results)} results retrieved"
+                        )
+                        return raw_results, provider_name, None, len(tasks)
+
+                    logger.warning(f"[WebSearch] {provider_name} returned empty results")
+                    last_error = Exception(f"{provider_name} returned no results")
+
+                # Everything that finished failed; fail over without waiting
+                if can_hedge:
+                    launch_next()
+    except TimeoutError:
+        last_error = TimeoutError(f"search budget of {overall_timeout:.1f}s exhausted")
+        logger.warning(f"[WebSearch] {last_error}")
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Let cancelled providers unwind (close their requests) before returning
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    return None, None, last_error, len(tasks)
+
+
+# ============================================================
+# PROVIDER ADAPTERS
+# ============================================================
+
+# Google's tbs recency format shared by Serper.dev and SerpAPI
+_GOOGLE_TBS = {
+    "day": "qdr:d",
+    "week": "qdr:w",
+    "month": "qdr:m",
+    "year": "qdr:y",
+}
+
+
+@dataclass(frozen=True)
+class ProviderAdapter:
+    """
+    Declarative description of a search provider.
+
+    A single request/normalization path (``_search_via_adapter``) is driven
+    by these descriptors, so adding a provider only requires a new entry.
+
+    Attributes:
+        name: Provider identifier reported in responses (e.g. 'serper')
+        label: Human-readable name used in logs and error messages
+        env_key: Environment variable holding the API key
+        url: Search endpoint
+        method: HTTP method ('GET' or 'POST')
+        build_request: Callable(query, num_results, date_filter, api_key)
+            returning httpx request kwargs (json/params/headers)
+        results_key: Key holding the result list in the response payload
+        field_map: Normalized field -> provider field ('title', 'snippet',
+            'url', 'date_published', optionally 'relevance_score')
+        max_snippet_chars: Optional snippet truncation length
+    """
 
-    logger.info(f"[Tavily] Searching: query='{query}', max_results={num_results}")
+    name: str
+    label: str
+    env_key: str
+    url: str
+    method: str
+    build_request: Callable[[str, int, Optional[str], str], Dict[str, Any]]
+    results_key: str
+    field_map: Dict[str, str]
+    max_snippet_chars: Optional[int] = None
 
-    # Initialize Tavily async client
-    client = AsyncTavilyClient(api_key=api_key)
 
-    # Build search parameters
+def _build_tavily_request(
+    query: str, num_results: int, date_filter: Optional[str], api_key: str
+) -> Dict[str, Any]:
     search_params = {
+        "api_key": api_key,
         "query": query,
         "max_results": num_results,
         "search_depth": "basic",  # "basic" is faster, "advanced" is more thorough
         "include_answer": False,  # We don't need LLM-generated answer
         "include_raw_content": False,  # We only need snippets
     }
-
-    # Map date_filter to Tavily's time_range parameter
-    # Tavily uses the same values: 'day', 'week', 'month', 'year'
+    # Tavily uses the same values as date_filter: 'day', 'week', 'month', 'year'
     if date_filter:
         search_params["time_range"] = date_filter
+    return {"json": search_params}
 
-    # Execute search with timeout
-    try:
-        response = await client.search(**search_params)
-    except Exception as e:
-        # Enhance error message for common issues
-        if "401" in str(e) or "Unauthorized" in str(e):
-            raise Exception(f"Invalid Tavily API key: {e}")
-        elif "429" in str(e) or "rate limit" in str(e).lower():
-            raise Exception(f"Tavily rate limit exceeded: {e}")
-        else:
-            raise Exception(f"Tavily API error: {e}")
-
-    # Normalize results to common format
-    results = []
-    for idx, result in enumerate(response.get("results", [])):
-        # Extract and truncate snippet
-        snippet = result.get("content", "")
-        if len(snippet) > 500:
-            snippet = snippet[:497] + "..."
-
-        normalized_result = {
-            "title": result.get("title", ""),
-            "snippet": snippet,
-            "url": result.get("url", ""),
-            "domain": extract_domain(result.get("url", "")),
-            "is_pdf": result.get("url", "").lower().endswith(".pdf"),
-            "relevance_score": result.get("score", 1.0 - (idx * 0.05)),
-            "content_type": "web_page",
-        }
 
-        # Add published date if available
-        if "published_date" in result and result["published_date"]:
-            normalized_result["date_published"] = result["published_date"]
+def _build_serper_request(
+    query: str, num_results: int, date_filter: Optional[str], api_key: str
+) -> Dict[str, Any]:
+    payload = {
+        "q": query,
+        "num": num_results,
+        "gl": "us",  # Geographic location (United States)
+        "hl": "en",  # Language (English)
+    }
+    if date_filter in _GOOGLE_TBS:
+        payload["tbs"] = _GOOGLE_TBS[date_filter]
+    return {
+        "json": payload,
+        "headers": {
+            "X-API-KEY": api_key,
+            "Content-Type": "application/json",
+        },
+    }
 
-        results.append(normalized_result)
 
-    logger.info(f"[Tavily] Retrieved {len(results)} results")
-    return results
+def _build_serpapi_request(
+    query: str, num_results: int, date_filter: Optional[str], api_key: str
+) -> Dict[str, Any]:
+    params = {
+        "q": query,
+        "num": num_results,
+        "api_key": api_key,
+        "engine": "google",
+    }
+    if date_filter in _GOOGLE_TBS:
+        params["tbs"] = _GOOGLE_TBS[date_filter]
+    return {"params": params}
+
+
+TAVILY = ProviderAdapter(
+    name="tavily",
+    label="Tavily",
+    env_key="TAVILY_API_KEY",
+    url="https://api.tavily.com/search",
+    method="POST",
+    build_request=_build_tavily_request,
+    results_key="results",
+    field_map={
+        "title": "title",
+        "snippet": "content",
+        "url": "url",
+        "relevance_score": "score",
+        "date_published": "published_date",
+    },
+    max_snippet_chars=500,
+)
+
+SERPER = ProviderAdapter(
+    name="serper",
+    label="Serper.dev",
+    env_key="SERPER_API_KEY",
+    url="https://google.serper.dev/search",
+    method="POST",
+    build_request=_build_serper_request,
+    results_key="organic",
+    field_map={
+        "title": "title",
+        "snippet": "snippet",
+        "url": "link",
+        "date_published": "date",  # Serper returns relative dates like "2 days ago"
+    },
+)
+
+SERPAPI = ProviderAdapter(
+    name="serpapi",
+    label="SerpAPI",
+    env_key="SERPAPI_API_KEY",
+    url="https://serpapi.com/search",
+    method="GET",
+    build_request=_build_serpapi_request,
+    results_key="organic_results",
+    field_map={
+        "title": "title",
+        "snippet": "snippet",
+        "url": "link",
+        "date_published": "date",
+    },
+)
+
+# Provider priority order: Tavily → Serper.dev → SerpAPI
+PROVIDER_ADAPTERS: Tuple[ProviderAdapter, ...] = (TAVILY, SERPER, SERPAPI)
+
+# (name, api_key) pairs for configured providers, in priority order
+_active_providers: Optional[Tuple[Tuple[str, str], ...]] = None
+_provider_keys: Optional[Tuple[Optional[str], ...]] = None
+
+
+def refresh_providers() -> Tuple[Tuple[str, str], ...]:
+    """
+    Re-read provider API keys and rebuild the active provider chain.
 
+    Called automatically on first search and whenever a key changes;
+    availability is logged only here rather than on every search.
 
-async def _search_serper(
+    Returns:
+        Tuple of (provider_name, api_key) for configured providers
+    """
+    global _active_providers, _provider_keys
+
+    # Ensure .env is loaded
+    load_dotenv(override=False)
+
+    keys = tuple(os.getenv(adapter.env_key) for adapter in PROVIDER_ADAPTERS)
+    _provider_keys = keys
+    _active_providers = tuple(
+        (adapter.name, api_key)
+        for adapter, api_key in zip(PROVIDER_ADAPTERS, keys)
+        if api_key
+    )
+
+    provider_status = {
+        adapter.name: ("configured" if api_key else "missing_api_key")
+        for adapter, api_key in zip(PROVIDER_ADAPTERS, keys)
+    }
+    logger.info("[WebSearch] Provider availability: %s", provider_status)
+    if not _active_providers:
+        logger.warning("[WebSearch] No search provider API keys configured")
+
+    return _active_providers
+
+
+def _get_active_providers() -> Tuple[Tuple[str, str], ...]:
+    """Return the cached provider chain, refreshing it if any key changed."""
+    if _active_providers is None or _provider_keys != tuple(
+        os.getenv(adapter.env_key) for adapter in PROVIDER_ADAPTERS
+    ):
+        return refresh_providers()
+    return _active_providers
+
+
+# ============================================================
+# PROVIDER IMPLEMENTATIONS
+# ============================================================
+
+async def _send_http(
+    adapter: ProviderAdapter,
+    query: str,
+    num_results: int,
+    date_filter: Optional[str],
+    api_key: str,
+) -> Dict[str, Any]:
+    """Issue the adapter's HTTP request and return the decoded JSON payload."""
+    request = adapter.build_request(query, num_results, date_filter, api_key)
+    response = await _get_client().request(
+        adapter.method, adapter.url, timeout=30.0, **request
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def _translate_provider_error(adapter: ProviderAdapter, error: Exception) -> Exception:
+    """Map transport/client errors onto descriptive provider exceptions."""
+    label = adapter.label
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        if status == 401:
+            return Exception(f"Invalid {label} API key: {error}")
+        if status == 429:
+            return Exception(f"{label} rate limit exceeded: {error}")
+        return Exception(f"{label} HTTP error {status}: {error}")
+    if isinstance(error, httpx.TimeoutException):
+        return Exception(f"{label} request timeout after 30s")
+    return Exception(f"{label} API error: {error}")
+
+
+async def _search_via_adapter(
+    adapter: ProviderAdapter,
     query: str,
     num_results: int,
     date_filter: Optional[str] = None,
     api_key: str = "",
 ) -> List[Dict[str, Any]]:
     """
-    Search using Serper.dev API (Google Search Results).
-
-    Serper.dev provides fast access to Google search results via API.
-    It's faster and cheaper than traditional SERP APIs.
+    Search using the provider described by ``adapter``.
 
     Args:
+        adapter: Provider descriptor
         query: Search query
         num_results: Number of results (1-20)
         date_filter: Time filter ('day', 'week', 'month', 'year')
-        api_key: Serper.dev API key
+        api_key: Provider API key
 
     Returns:
         List of normalized search results
@@ -377,170 +757,58 @@ async def _search_serper(
     Raises:
         Exception: If API request fails (timeout, auth error, rate limit, etc.)
     """
-    logger.info(f"[Serper] Searching: query='{query}', num={num_results}")
-
-    # Build request payload
-    payload = {
-        "q": query,
-        "num": num_results,
-        "gl": "us",  # Geographic location (United States)
-        "hl": "en",  # Language (English)
-    }
-
-    # Map date_filter to Serper's tbs parameter
-    # Google's tbs format: qdr:d (day), qdr:w (week), qdr:m (month), qdr:y (year)
-    if date_filter == "day":
-        payload["tbs"] = "qdr:d"
-    elif date_filter == "week":
-        payload["tbs"] = "qdr:w"
-    elif date_filter == "month":
-        payload["tbs"] = "qdr:m"
-    elif date_filter == "year":
-        payload["tbs"] = "qdr:y"
-
-    # Make POST request to Serper.dev
-    headers = {
-        "X-API-KEY": api_key,
-        "Content-Type": "application/json",
-    }
+    logger.info(f"[{adapter.label}] Searching: query='{query}', num={num_results}")
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://google.serper.dev/search",
-                json=payload,
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 401:
-            raise Exception(f"Invalid Serper.dev API key: {e}")
-        elif e.response.status_code == 429:
-            raise Exception(f"Serper.dev rate limit exceeded: {e}")
-        else:
-            raise Exception(f"Serper.dev HTTP error {e.response.status_code}: {e}")
-    except httpx.TimeoutException:
-        raise Exception("Serper.dev request timeout after 30s")
+        data = await _send_http(adapter, query, num_results, date_filter, api_key)
     except Exception as e:
-        raise Exception(f"Serper.dev API error: {e}")
-
-    # Extract organic results
-    organic_results = data.get("organic", [])
-
-    # Normalize results to common format
-    results = []
-    for idx, result in enumerate(organic_results[:num_results]):
-        normalized_result = {
-            "title": result.get("title", ""),
-            "snippet": result.get("snippet", ""),
-            "url": result.get("link", ""),
-            "domain": extract_domain(result.get("link", "")),
-            "is_pdf": result.get("link", "").lower().endswith(".pdf"),
-            "relevance_score": 1.0 - (idx * 0.05),
-            "content_type": "web_page",
-        }
+        raise _translate_provider_error(adapter, e)
 
-        # Add date if available (Serper returns relative dates like "2 days ago")
-        if "date" in result and result["date"]:
-            normalized_result["date_published"] = result["date"]
-
-        results.append(normalized_result)
+    results = normalize_results(
+        data.get(adapter.results_key, []),
+        adapter.field_map,
+        num_results,
+        adapter.max_snippet_chars,
+    )
 
-    logger.info(f"[Serper] Retrieved {len(results)} results")
+    logger.info(f"[{adapter.label}] Retrieved {len(results)} results")
     return results
 
 
-async def _search_serpapi(
+async def _search_tavily(
     query: str,
     num_results: int,
     date_filter: Optional[str] = None,
     api_key: str = "",
 ) -> List[Dict[str, Any]]:
-    """
-    Search using SerpAPI (Google Search).
+    """Search using Tavily API (AI-optimized search with relevance scoring)."""
+    return await _search_via_adapter(TAVILY, query, num_results, date_filter, api_key)
 
-    SerpAPI is a well-established SERP API provider with comprehensive
-    Google search result parsing.
 
-    Args:
-        query: Search query
-        num_results: Number of results (1-20)
-        date_filter: Time filter ('day', 'week', 'month', 'year')
-        api_key: SerpAPI key
-
-    Returns:
-        List of normalized search results
-
-    Raises:
-        Exception: If API request fails (timeout, auth error, rate limit, etc.)
-    """
-    logger.info(f"[SerpAPI] Searching: query='{query}', num={num_results}")
-
-    # Map date_filter to SerpAPI's tbs parameter
-    tbs_param = None
-    if date_filter == "day":
-        tbs_param = "qdr:d"
-    elif date_filter == "week":
-        tbs_param = "qdr:w"
-    elif date_filter == "month":
-        tbs_param = "qdr:m"
-    elif date_filter == "year":
-        tbs_param = "qdr:y"
-
-    # Build request parameters
-    params = {
-        "q": query,
-        "num": num_results,
-        "api_key": api_key,
-        "engine": "google",
-    }
-
-    if tbs_param:
-        params["tbs"] = tbs_param
+async def _search_serper(
+    query: str,
+    num_results: int,
+    date_filter: Optional[str] = None,
+    api_key: str = "",
+) -> List[Dict[str, Any]]:
+    """Search using Serper.dev API (Google Search Results)."""
+    return await _search_via_adapter(SERPER, query, num_results, date_filter, api_key)
 
-    # Make GET request to SerpAPI
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                "https://serpapi.com/search",
-                params=params,
-            )
-            response.raise_for_status()
-            data = response.json()
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 401:
-            raise Exception(f"Invalid SerpAPI key: {e}")
-        elif e.response.status_code == 429:
-            raise Exception(f"SerpAPI rate limit exceeded: {e}")
-        else:
-            raise Exception(f"SerpAPI HTTP error {e.response.status_code}: {e}")
-    except httpx.TimeoutException:
-        raise Exception("SerpAPI request timeout after 30s")
-    except Exception as e:
-        raise Exception(f"SerpAPI error: {e}")
-
-    # Extract organic results
-    organic_results = data.get("organic_results", [])
-
-    # Normalize results to common format
-    results = []
-    for idx, result in enumerate(organic_results[:num_results]):
-        normalized_result = {
-            "title": result.get("title", ""),
-            "snippet": result.get("snippet", ""),
-            "url": result.get("link", ""),
-            "domain": extract_domain(result.get("link", "")),
-            "is_pdf": result.get("link", "").lower().endswith(".pdf"),
-            "relevance_score": 1.0 - (idx * 0.05),
-            "content_type": "web_page",
-        }
 
-        # Add date if available
-        if "date" in result and result["date"]:
-            normalized_result["date_published"] = result["date"]
+async def _search_serpapi(
+    query: str,
+    num_results: int,
+    date_filter: Optional[str] = None,
+    api_key: str = "",
+) -> List[Dict[str, Any]]:
+    """Search using SerpAPI (Google Search)."""
+    return await _search_via_adapter(SERPAPI, query, num_results, date_filter, api_key)
 
-        results.append(normalized_result)
 
-    logger.info(f"[SerpAPI] Retrieved {len(results)} results")
-    return results
+def _provider_search_functions() -> Dict[str, Callable[..., Awaitable[List[Dict[str, Any]]]]]:
+    """Resolve provider entry points at call time (keeps them patchable in tests)."""
+    return {
+        "tavily": _search_tavily,
+        "serper": _search_serper,
+        "serpapi": _search_serpapi,
+    }
@@ -4,11 +4,14 @@ Tracing System
 Provides comprehensive tracing and observability integration.
 """
 
-from .langsmith import LangSmithTracer, init_langsmith
+from .langsmith import BaseTracer, LangSmithTracer, init_langsmith
+from .async_langsmith import AsyncLangSmithTracer
 from .decorators import traceable, trace_async
 
 __all__ = [
+    "BaseTracer",
     "LangSmithTracer",
+    "AsyncLangSmithTracer",
     "init_langsmith",
     "traceable",
     "trace_async",
@@ -0,0 +1,268 @@
+"""
+Async LangSmith Tracing Integration
+
+Event-loop friendly counterpart of LangSmithTracer for async call sites.
+"""
+
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+# Try to import the LangSmith async client (optional dependency)
+try:
+    from langsmith import AsyncClient
+    from langsmith.run_trees import RunTree
+
+    ASYNC_LANGSMITH_AVAILABLE = True
+except ImportError:
+    ASYNC_LANGSMITH_AVAILABLE = False
+
+
+class AsyncLangSmithTracer:
+    """
+    Async LangSmith tracing integration.
+
+    Uses ``langsmith.AsyncClient`` so uploads are awaited on the caller's
+    event loop instead of blocking it. Pick this tracer from async code
+    (agents, FastAPI handlers); LangSmithTracer remains the choice for sync
+    call sites, where it offloads uploads to a background thread pool.
+
+    Events logged with log_event are kept in memory and sent with the
+    closing update in end_run.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        project_name: str = "agentic-research",
+        enabled: bool = True,
+        timeout_ms: int = 2000,
+    ):
+        """
+        Initialize async LangSmith tracer.
+
+        Args:
+            api_key: LangSmith API key (or use LANGSMITH_API_KEY env var)
+            project_name: Project name in LangSmith
+            enabled: Enable/disable tracing
+            timeout_ms: Per-request timeout for LangSmith API calls
+        """
+        self.enabled = enabled and ASYNC_LANGSMITH_AVAILABLE
+        self.project_name = project_name
+        self._run_url_prefix = (
+            f"https://smith.langchain.com/o/default/projects/{project_name}/r/"
+        )
+        self.client: Optional[Any] = None
+        self.active_runs: Dict[str, Any] = {}
+
+        if not self.enabled:
+            if not ASYNC_LANGSMITH_AVAILABLE:
+                logger.info("Async LangSmith tracing disabled (library not installed)")
+            return
+
+        self.api_key = api_key or os.getenv("LANGSMITH_API_KEY")
+        if not self.api_key:
+            logger.warning(
+                "LangSmith API key not provided. Async tracing disabled. "
+                "Set LANGSMITH_API_KEY environment variable."
+            )
+            self.enabled = False
+            return
+
+        try:
+            self.client = AsyncClient(api_key=self.api_key, timeout_ms=timeout_ms)
+            logger.info(f"Async LangSmith tracing enabled (project: {project_name})")
+        except Exception as e:
+            logger.error(f"Failed to initialize async LangSmith client: {e}")
+            self.enabled = False
+
+    async def start_run(
+        self,
+        name: str,
+        run_type: str = "chain",
+        inputs: Optional[Dict[str, Any]] = None,
+        parent_run_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Start a new trace run.
+
+        Args:
+            name: Run name
+            run_type: Type of run ('chain', 'llm', 'tool', 'retriever')
+            inputs: Input data
+            parent_run_id: Parent run ID for hierarchical tracing
+            tags: List of tags
+            metadata: Additional metadata
+
+        Returns:
+            Run ID if successful, None otherwise
+        """
+        if not self.enabled or not self.client:
+            return None
+
+        try:
+            # RunTree is used only to derive ids/trace ordering; uploads go
+            # through the async client below
+            run = RunTree(
+                name=name,
+                run_type=run_type,
+                inputs=inputs or {},
+                project_name=self.project_name,
+                tags=tags or [],
+                extra=metadata or {},
+                parent_run=self.active_runs.get(parent_run_id) if parent_run_id else None,
+            )
+            run_id = str(run.id)
+            self.active_runs[run_id] = run
+
+            await self.client.create_run(
+                name=run.name,
+                inputs=run.inputs,
+                run_type=run.run_type,
+                project_name=self.project_name,
+                id=run.id,
+                start_time=run.start_time,
+                parent_run_id=run.parent_run_id,
+                trace_id=run.trace_id,
+                dotted_order=run.dotted_order,
+                tags=run.tags,
+                extra=run.extra,
+            )
+
+            logger.debug(f"Started async LangSmith run: {name} (ID: {run_id})")
+            return run_id
+
+        except Exception as e:
+            logger.error(f"Failed to start async LangSmith run: {e}")
+            return None
+
+    async def end_run(
+        self,
+        run_id: str,
+        outputs: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        End a trace run.
+
+        Args:
+            run_id: Run ID to end
+            outputs: Output data
+            error: Error message if run failed
+        """
+        if not self.enabled:
+            return
+
+        run = self.active_runs.pop(run_id, None)
+        if run is None:
+            return
+
+        try:
+            if error:
+                run.end(error=error)
+            else:
+                run.end(outputs=outputs or {})
+
+            await self.client.update_run(
+                run.id,
+                end_time=run.end_time,
+                outputs=run.outputs,
+                error=run.error,
+                extra=run.extra,
+                parent_run_id=run.parent_run_id,
+                trace_id=run.trace_id,
+                dotted_order=run.dotted_order,
+            )
+
+            logger.debug(f"Ended async LangSmith run: {run_id}")
+
+        except Exception as e:
+            logger.error(f"Failed to end async LangSmith run: {e}")
+
+    def log_event(
+        self,
+        run_id: str,
+        event_type: str,
+        data: Dict[str, Any],
+    ) -> None:
+        """
+        Log an event within a run (sent with the run's closing update).
+
+        Args:
+            run_id: Run ID
+            event_type: Event type
+            data: Event data
+        """
+        run = self.active_runs.get(run_id) if self.enabled else None
+        if run is None:
+            return
+
+        if getattr(run, "extra", None) is None:
+            run.extra = {}
+        run.extra.setdefault("events", []).append({
+            "timestamp": datetime.utcfromtimestamp(time.time()).isoformat(),
+            "type": event_type,
+            "data": data,
+        })
+
+    @asynccontextmanager
+    async def trace_context(
+        self,
+        name: str,
+        run_type: str = "chain",
+        inputs: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None,
+    ):
+        """
+        Async context manager for tracing a block of code.
+
+        Args:
+            name: Run name
+            run_type: Type of run
+            inputs: Input data
+            tags: List of tags
+
+        Example:
+            async with tracer.trace_context("research_session", inputs={"query": "..."}):
+                await run_research()
+        """
+        run_id = await self.start_run(name, run_type, inputs, tags=tags)
+
+        try:
+            yield run_id
+        except Exception as e:
+            if run_id:
+                await self.end_run(run_id, error=str(e))
+            raise
+        else:
+            if run_id:
+                await self.end_run(run_id, outputs={"status": "success"})
+
+    def get_run_url(self, run_id: str) -> Optional[str]:
+        """
+        Get LangSmith UI URL for a run.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            URL to view run in LangSmith UI
+        """
+        if not self.enabled or not self.client:
+            return None
+
+        return f"{self._run_url_prefix}{run_id}"
+
+    async def aclose(self) -> None:
+        """Close the underlying async HTTP client."""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+        self.enabled = False
@@ -4,9 +4,17 @@ LangSmith Tracing Integration
 Provides integration with LangSmith for comprehensive tracing and observability.
 """
 
+import atexit
+from abc import ABC, abstractmethod
+import hashlib
+import json
 import logging
 import os
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from contextlib import contextmanager
 
@@ -17,6 +25,9 @@ try:
     from langsmith import Client
     from langsmith.run_helpers import traceable as langsmith_traceable
     from langsmith.run_trees import RunTree
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 
     LANGSMITH_AVAILABLE = True
 except ImportError:
@@ -27,12 +38,273 @@ except ImportError:
     )
 
 
-class LangSmithTracer:
+class BaseTracer(ABC):
+    """
+    Tracer interface shared by the LangSmith tracer and the no-op tracer.
+
+    Subclasses implement the run primitives; the session/iteration/tool
+    helpers are built on top of them.
+    """
+
+    enabled: bool = False
+
+    @abstractmethod
+    def start_run(
+        self,
+        name: str,
+        run_type: str = "chain",
+        inputs: Optional[Dict[str, Any]] = None,
+        parent_run_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """Start a new trace run and return its ID."""
+        pass
+
+    @abstractmethod
+    def end_run(
+        self,
+        run_id: str,
+        outputs: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """End a trace run."""
+        pass
+
+    @abstractmethod
+    def log_event(
+        self,
+        run_id: str,
+        event_type: str,
+        data: Dict[str, Any],
+    ) -> None:
+        """Log an event within a run."""
+        pass
+
+    @abstractmethod
+    def get_run_url(self, run_id: str) -> Optional[str]:
+        """Get the UI URL for a run."""
+        pass
+
+    def flush(self) -> None:
+        """Block until pending uploads have completed."""
+        pass
+
+    def shutdown(self) -> None:
+        """Release background resources."""
+        pass
+
+    @contextmanager
+    def trace_context(
+        self,
+        name: str,
+        run_type: str = "chain",
+        inputs: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None,
+    ):
+        """
+        Context manager for tracing a block of code.
+
+        Args:
+            name: Run name
+            run_type: Type of run
+            inputs: Input data
+            tags: List of tags
+
+        Example:
+            with tracer.trace_context("research_session", inputs={"query": "..."}):
+                # Your code here
+                pass
+        """
+        run_id = self.start_run(name, run_type, inputs, tags=tags)
+
+        try:
+            yield run_id
+        except Exception as e:
+            if run_id:
+                self.end_run(run_id, error=str(e))
+            raise
+        else:
+            if run_id:
+                self.end_run(run_id, outputs={"status": "success"})
+
+    def trace_research_session(
+        self,
+        session_id: str,
+        query: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Start tracing a research session.
+
+        Args:
+            session_id: Research session ID
+            query: Research query
+            metadata: Additional metadata
+
+        Returns:
+            Run ID for the session
+        """
+        return self.start_run(
+            name=f"research_session_{session_id}",
+            run_type="chain",
+            inputs={"query": query, "session_id": session_id},
+            tags=["research", "session"],
+            metadata=metadata,
+        )
+
+    def trace_iteration(
+        self,
+        session_run_id: str,
+        iteration: int,
+        thought: str,
+        action: str,
+        action_input: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Trace a ReAct iteration.
+
+        Args:
+            session_run_id: Parent session run ID
+            iteration: Iteration number
+            thought: Agent's thought
+            action: Action taken
+            action_input: Action parameters
+
+        Returns:
+            Run ID for the iteration
+        """
+        return self.start_run(
+            name=f"iteration_{iteration}",
+            run_type="chain",
+            inputs={
+                "thought": thought,
+                "action": action,
+                "action_input": action_input,
+            },
+            parent_run_id=session_run_id,
+            tags=["iteration", f"iteration_{iteration}"],
+        )
+
+    def trace_tool_execution(
+        self,
+        iteration_run_id: str,
+        tool_name: str,
+        tool_input: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Trace a tool execution.
+
+        Args:
+            iteration_run_id: Parent iteration run ID
+            tool_name: Tool name
+            tool_input: Tool parameters
+
+        Returns:
+            Run ID for the tool execution
+        """
+        return self.start_run(
+            name=tool_name,
+            run_type="tool",
+            inputs=tool_input,
+            parent_run_id=iteration_run_id,
+            tags=["tool", tool_name],
+        )
+
+
+class _NoOpTracer(BaseTracer):
+    """Tracer used when tracing is disabled; every call is a trivial return."""
+
+    enabled = False
+
+    def start_run(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def end_run(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def log_event(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def get_run_url(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def trace_research_session(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def trace_iteration(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def trace_tool_execution(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    @contextmanager
+    def trace_context(self, *args: Any, **kwargs: Any):
+        yield None
+
+
+_NOOP_TRACER = _NoOpTracer()
+
+
+class _StripedRunMap:
+    """
+    Thread-safe run_id -> RunTree map split across independently locked stripes.
+
+    Callers on different runs (and the background flusher) rarely contend
+    for the same lock.
+    """
+
+    _STRIPES = 16
+
+    def __init__(self) -> None:
+        self._stripes = [(threading.Lock(), {}) for _ in range(self._STRIPES)]
+
+    def _bucket(self, run_id: str) -> Tuple[threading.Lock, Dict[str, Any]]:
+        return self._stripes[hash(run_id) & (self._STRIPES - 1)]
+
+    def get(self, run_id: str, default: Any = None) -> Any:
+        lock, runs = self._bucket(run_id)
+        with lock:
+            return runs.get(run_id, default)
+
+    def pop(self, run_id: str, default: Any = None) -> Any:
+        lock, runs = self._bucket(run_id)
+        with lock:
+            return runs.pop(run_id, default)
+
+    def __getitem__(self, run_id: str) -> Any:
+        lock, runs = self._bucket(run_id)
+        with lock:
+            return runs[run_id]
+
+    def __setitem__(self, run_id: str, run: Any) -> None:
+        lock, runs = self._bucket(run_id)
+        with lock:
+            runs[run_id] = run
+
+    def __delitem__(self, run_id: str) -> None:
+        lock, runs = self._bucket(run_id)
+        with lock:
+            del runs[run_id]
+
+    def __contains__(self, run_id: object) -> bool:
+        lock, runs = self._bucket(run_id)  # type: ignore[arg-type]
+        with lock:
+            return run_id in runs
+
+    def __len__(self) -> int:
+        return sum(len(runs) for _, runs in self._stripes)
+
+
+class LangSmithTracer(BaseTracer):
     """
     LangSmith tracing integration.
 
     Provides hierarchical tracing of research sessions with automatic
-    upload to LangSmith platform.
+    upload to LangSmith platform. Network calls (run.post/run.patch) run on
+    a background thread pool so tracing never blocks the caller; operations
+    on the same run (and a child after its parent) are kept in order.
+    Logged events are buffered and sent as one patch per run per flush.
     """
 
     def __init__(
@@ -40,6 +312,10 @@ class LangSmithTracer:
         api_key: Optional[str] = None,
         project_name: str = "agentic-research",
         enabled: bool = True,
+        flush_interval: float = 0.5,
+        cache_ttl_seconds: float = 0,
+        timeout_ms: int = 2000,
+        max_in_flight: int = 256,
     ):
         """
         Initialize LangSmith tracer.
@@ -48,11 +324,42 @@ class LangSmithTracer:
             api_key: LangSmith API key (or use LANGSMITH_API_KEY env var)
             project_name: Project name in LangSmith
             enabled: Enable/disable tracing
+            flush_interval: Seconds between background event flushes
+            cache_ttl_seconds: Reuse the run id of an identical run (same name,
+                type, parent and inputs) started within this window and still
+                open, instead of posting a new run. The shared run ends when
+                every caller has ended it. 0 disables deduplication.
+            timeout_ms: Per-request timeout for LangSmith API calls
+            max_in_flight: Maximum queued/running event flushes; further
+                flushes are dropped (with a warning) while LangSmith is slow
+                or down. Run creation and the final update are always sent
         """
         self.enabled = enabled and LANGSMITH_AVAILABLE
         self.project_name = project_name
+        self._run_url_prefix = (
+            f"https://smith.langchain.com/o/default/projects/{project_name}/r/"
+        )
         self.client: Optional[Any] = None
-        self.active_runs: Dict[str, Any] = {}
+        self._http_session: Optional[Any] = None
+        self.active_runs = _StripedRunMap()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._run_futures: Dict[str, Future] = {}
+        self._pending: set = set()
+        self._pending_lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._dropped = 0
+        self._submit_lock = threading.RLock()
+        self._event_buffer: Dict[str, List[Tuple[float, str, Dict[str, Any]]]] = defaultdict(list)
+        self._buffer_lock = threading.Lock()
+        self._flush_interval = flush_interval
+        self._flush_stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._cache_ttl = cache_ttl_seconds
+        self._run_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        # Open callers per deduplicated run, and the cache key each run sits under
+        self._run_refs: Dict[str, int] = {}
+        self._run_cache_keys: Dict[str, str] = {}
+        self._cache_lock = threading.Lock()
 
         if not self.enabled:
             if not LANGSMITH_AVAILABLE:
@@ -73,13 +380,38 @@ class LangSmithTracer:
             return
 
         try:
-            # Initialize LangSmith client
-            self.client = Client(api_key=self.api_key)
+            # Initialize LangSmith client on a pooled keep-alive session so
+            # background uploads reuse TLS connections instead of reconnecting
+            self._http_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+            self._http_session.mount("https://", adapter)
+            self._http_session.mount("http://", adapter)
+            self.client = Client(
+                api_key=self.api_key,
+                session=self._http_session,
+                timeout_ms=timeout_ms,
+                retry_config=Retry(
+                    total=2,
+                    backoff_factor=0.25,
+                    status_forcelist=[408, 425, 429, 502, 503, 504],
+                    allowed_methods=None,
+                    raise_on_status=False,
+                ),
+            )
 
             # Set environment variables for langsmith decorator
             os.environ["LANGSMITH_API_KEY"] = self.api_key
             os.environ["LANGSMITH_PROJECT"] = self.project_name
 
+            self._executor = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="langsmith"
+            )
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="langsmith-flusher", daemon=True
+            )
+            self._flusher.start()
+            atexit.register(self.shutdown)
+
             logger.info(f"LangSmith tracing enabled (project: {project_name})")
 
         except Exception as e:
@@ -112,6 +444,14 @@ class LangSmithTracer:
         if not self.enabled or not self.client:
             return None
 
+        cache_key = None
+        if self._cache_ttl > 0:
+            cache_key = self._run_cache_key(name, run_type, parent_run_id, inputs)
+            cached_run_id = self._get_cached_run(cache_key)
+            if cached_run_id:
+                logger.debug(f"Reusing LangSmith run for duplicate {name}: {cached_run_id}")
+                return cached_run_id
+
         try:
             run = RunTree(
                 name=name,
@@ -120,14 +460,25 @@ class LangSmithTracer:
                 project_name=self.project_name,
                 tags=tags or [],
                 extra=metadata or {},
+                client=self.client,
                 parent_run=self.active_runs.get(parent_run_id) if parent_run_id else None,
             )
 
-            run.post()  # Upload to LangSmith
+            # RunTree ids are generated client-side, so the run can be
+            # registered before the upload completes
             run_id = str(run.id)
-
             self.active_runs[run_id] = run
 
+            self._submit(
+                run_id,
+                run.post,  # Upload to LangSmith
+                after=self._run_futures.get(parent_run_id) if parent_run_id else None,
+                required=True,
+            )
+
+            if cache_key:
+                self._store_cached_run(cache_key, run_id)
+
             logger.debug(f"Started LangSmith run: {name} (ID: {run_id})")
             return run_id
 
@@ -135,6 +486,64 @@ class LangSmithTracer:
             logger.error(f"Failed to start LangSmith run: {e}")
             return None
 
+    @staticmethod
+    def _run_cache_key(
+        name: str,
+        run_type: str,
+        parent_run_id: Optional[str],
+        inputs: Optional[Dict[str, Any]],
+    ) -> str:
+        payload = json.dumps(
+            {"n": name, "t": run_type, "p": parent_run_id, "i": inputs or {}},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _get_cached_run(self, cache_key: str) -> Optional[str]:
+        """Return an open run for ``cache_key`` and count the new caller on it."""
+        with self._cache_lock:
+            entry = self._run_cache.get(cache_key)
+            if entry is None:
+                return None
+            run_id, expires_at = entry
+            if time.monotonic() >= expires_at or run_id not in self._run_refs:
+                del self._run_cache[cache_key]
+                return None
+            self._run_cache.move_to_end(cache_key)
+            self._run_refs[run_id] += 1
+            return run_id
+
+    def _store_cached_run(self, cache_key: str, run_id: str) -> None:
+        with self._cache_lock:
+            self._run_cache[cache_key] = (run_id, time.monotonic() + self._cache_ttl)
+            self._run_cache.move_to_end(cache_key)
+            self._run_refs[run_id] = 1
+            self._run_cache_keys[run_id] = cache_key
+            while len(self._run_cache) > 256:
+                self._run_cache.popitem(last=False)
+
+    def _release_cached_run(self, run_id: str) -> bool:
+        """
+        Drop one caller's hold on a deduplicated run.
+
+        Returns:
+            True if other callers still hold the run and it must stay open
+        """
+        with self._cache_lock:
+            refs = self._run_refs.get(run_id)
+            if refs is None:
+                return False
+            if refs > 1:
+                self._run_refs[run_id] = refs - 1
+                return True
+            del self._run_refs[run_id]
+            cache_key = self._run_cache_keys.pop(run_id, None)
+            entry = self._run_cache.get(cache_key) if cache_key else None
+            if entry is not None and entry[0] == run_id:
+                del self._run_cache[cache_key]
+            return False
+
     def end_run(
         self,
         run_id: str,
@@ -149,21 +558,31 @@ class LangSmithTracer:
             outputs: Output data
             error: Error message if run failed
         """
-        if not self.enabled or run_id not in self.active_runs:
+        if not self.enabled:
             return
 
+        run = self.active_runs.get(run_id)
+        if run is None:
+            return
+        if self._cache_ttl > 0 and self._release_cached_run(run_id):
+            return  # Another caller still uses this deduplicated run
+
         try:
-            run = self.active_runs[run_id]
+            # Buffered events ride along with the closing patch
+            with self._buffer_lock:
+                self._merge_events(run, self._event_buffer.pop(run_id, []))
 
             if error:
                 run.end(error=error)
             else:
                 run.end(outputs=outputs or {})
 
-            run.patch()  # Update in LangSmith
+            self._submit(run_id, run.patch, required=True)  # Update in LangSmith
 
             # Remove from active runs
-            del self.active_runs[run_id]
+            self.active_runs.pop(run_id, None)
+            with self._submit_lock:
+                self._run_futures.pop(run_id, None)
 
             logger.debug(f"Ended LangSmith run: {run_id}")
 
@@ -188,142 +607,144 @@ class LangSmithTracer:
             return
 
         try:
-            run = self.active_runs[run_id]
-
-            # Add event to run metadata
-            if not hasattr(run, "extra"):
-                run.extra = {}
-
-            if "events" not in run.extra:
-                run.extra["events"] = []
-
-            run.extra["events"].append({
-                "timestamp": datetime.utcnow().isoformat(),
-                "type": event_type,
-                "data": data,
-            })
-
-            run.patch()  # Update in LangSmith
+            # Raw epoch timestamp; ISO formatting is deferred to the flush.
+            # Uploaded by the background flusher (or end_run), not per event
+            event = (time.time(), event_type, data)
+            with self._buffer_lock:
+                self._event_buffer[run_id].append(event)
 
         except Exception as e:
             logger.error(f"Failed to log event to LangSmith: {e}")
 
-    @contextmanager
-    def trace_context(
-        self,
-        name: str,
-        run_type: str = "chain",
-        inputs: Optional[Dict[str, Any]] = None,
-        tags: Optional[List[str]] = None,
-    ):
-        """
-        Context manager for tracing a block of code.
-
-        Args:
-            name: Run name
-            run_type: Type of run
-            inputs: Input data
-            tags: List of tags
-
-        Example:
-            with tracer.trace_context("research_session", inputs={"query": "..."}):
-                # Your code here
-                pass
-        """
-        run_id = self.start_run(name, run_type, inputs, tags=tags)
-
-        try:
-            yield run_id
-        except Exception as e:
-            if run_id:
-                self.end_run(run_id, error=str(e))
-            raise
-        else:
-            if run_id:
-                self.end_run(run_id, outputs={"status": "success"})
-
-    def trace_research_session(
-        self,
-        session_id: str,
-        query: str,
-        metadata: Optional[Dict[str, Any]] = None,
-    ) -> Optional[str]:
-        """
-        Start tracing a research session.
-
-        Args:
-            session_id: Research session ID
-            query: Research query
-            metadata: Additional metadata
-
-        Returns:
-            Run ID for the session
-        """
-        return self.start_run(
-            name=f"research_session_{session_id}",
-            run_type="chain",
-            inputs={"query": query, "session_id": session_id},
-            tags=["research", "session"],
-            metadata=metadata,
-        )
-
-    def trace_iteration(
-        self,
-        session_run_id: str,
-        iteration: int,
-        thought: str,
-        action: str,
-        action_input: Dict[str, Any],
-    ) -> Optional[str]:
-        """
-        Trace a ReAct iteration.
-
-        Args:
-            session_run_id: Parent session run ID
-            iteration: Iteration number
-            thought: Agent's thought
-            action: Action taken
-            action_input: Action parameters
-
-        Returns:
-            Run ID for the iteration
-        """
-        return self.start_run(
-            name=f"iteration_{iteration}",
-            run_type="chain",
-            inputs={
-                "thought": thought,
-                "action": action,
-                "action_input": action_input,
-            },
-            parent_run_id=session_run_id,
-            tags=["iteration", f"iteration_{iteration}"],
+    @staticmethod
+    def _merge_events(
+        run: Any, events: List[Tuple[float, str, Dict[str, Any]]]
+    ) -> None:
+        if not events:
+            return
+        if getattr(run, "extra", None) is None:
+            run.extra = {}
+        # Kept as plain dicts: the SDK serializes the whole run with orjson
+        # once per patch, so pre-encoding here would only add a second pass
+        run.extra.setdefault("events", []).extend(
+            {
+                "timestamp": datetime.utcfromtimestamp(ts).isoformat(),
+                "type": event_type,
+                "data": data,
+            }
+            for ts, event_type, data in events
         )
 
-    def trace_tool_execution(
+    def _flush_events(self) -> None:
+        """Merge buffered events into their runs and send one patch per run."""
+        with self._buffer_lock:
+            if not self._event_buffer:
+                return
+            buffered, self._event_buffer = self._event_buffer, defaultdict(list)
+            touched = []
+            for run_id, events in buffered.items():
+                run = self.active_runs.get(run_id)
+                if run is not None:
+                    self._merge_events(run, events)
+                    touched.append((run_id, run))
+
+        for run_id, run in touched:
+            if run_id in self.active_runs:  # end_run already sent it otherwise
+                self._submit(run_id, run.patch)
+
+    def _flush_loop(self) -> None:
+        while not self._flush_stop.wait(self._flush_interval):
+            try:
+                self._flush_events()
+            except Exception as e:
+                logger.error(f"Failed to flush LangSmith events: {e}")
+
+    def _submit(
         self,
-        iteration_run_id: str,
-        tool_name: str,
-        tool_input: Dict[str, Any],
-    ) -> Optional[str]:
+        run_id: str,
+        fn: Callable[[], Any],
+        after: Optional[Future] = None,
+        required: bool = False,
+    ) -> None:
         """
-        Trace a tool execution.
+        Run a LangSmith network call on the background executor.
 
         Args:
-            iteration_run_id: Parent iteration run ID
-            tool_name: Tool name
-            tool_input: Tool parameters
-
-        Returns:
-            Run ID for the tool execution
+            run_id: Run the call belongs to (calls per run execute in order)
+            fn: Zero-argument callable performing the upload
+            after: Optional future that must finish first (e.g. parent post)
+            required: Always queue the call (run creation / final update).
+                Other calls are best-effort and dropped once max_in_flight
+                of them are pending
         """
-        return self.start_run(
-            name=tool_name,
-            run_type="tool",
-            inputs=tool_input,
-            parent_run_id=iteration_run_id,
-            tags=["tool", tool_name],
-        )
+        with self._submit_lock:
+            previous = self._run_futures.get(run_id) or after
+            if self._executor is None:
+                self._run_call(fn, previous)
+                return
+
+            # Drop event flushes rather than queue without bound when uploads
+            # back up; the final patch still carries the merged events
+            counted = not required
+            if counted and not self._in_flight.acquire(blocking=False):
+                self._dropped += 1
+                if self._dropped == 1 or self._dropped % 100 == 0:
+                    logger.warning(
+                        f"LangSmith upload queue full; dropped {self._dropped} update(s)"
+                    )
+                return
+
+            future = self._executor.submit(self._run_call, fn, previous)
+            with self._pending_lock:
+                self._pending.add(future)
+            future.add_done_callback(
+                self._on_counted_done if counted else self._on_done
+            )
+            self._run_futures[run_id] = future
+
+    @staticmethod
+    def _run_call(fn: Callable[[], Any], previous: Optional[Future]) -> Any:
+        # Earlier submissions are dequeued first, so waiting here cannot deadlock
+        if previous is not None:
+            try:
+                previous.result()
+            except Exception:
+                pass  # Already logged by its own callback
+        return fn()
+
+    def _on_counted_done(self, future: Future) -> None:
+        self._in_flight.release()
+        self._on_done(future)
+
+    def _on_done(self, future: Future) -> None:
+        with self._pending_lock:
+            self._pending.discard(future)
+        error = future.exception()
+        if error is not None:
+            logger.error(f"LangSmith background upload failed: {error}")
+
+    def flush(self) -> None:
+        """Send buffered events and block until all uploads have completed."""
+        self._flush_events()
+        with self._pending_lock:
+            pending = list(self._pending)
+        wait(pending)
+
+    def shutdown(self) -> None:
+        """Drain pending uploads and stop the background executor."""
+        if self._executor is None:
+            return
+        self._flush_stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self._flush_events()
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        self._run_futures.clear()
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
 
     def get_run_url(self, run_id: str) -> Optional[str]:
         """
@@ -338,21 +759,18 @@ class LangSmithTracer:
         if not self.enabled or not self.client:
             return None
 
-        try:
-            return f"https://smith.langchain.com/o/default/projects/{self.project_name}/r/{run_id}"
-        except Exception:
-            return None
+        return f"{self._run_url_prefix}{run_id}"
 
 
 # Global tracer instance
-_global_tracer: Optional[LangSmithTracer] = None
+_global_tracer: Optional[BaseTracer] = None
 
 
 def init_langsmith(
     api_key: Optional[str] = None,
     project_name: str = "agentic-research",
     enabled: bool = True,
-) -> LangSmithTracer:
+) -> BaseTracer:
     """
     Initialize global LangSmith tracer.
 
@@ -362,22 +780,29 @@ def init_langsmith(
         enabled: Enable/disable tracing
 
     Returns:
-        LangSmithTracer instance
+        LangSmithTracer instance, or a no-op tracer when tracing is disabled
     """
     global _global_tracer
-    _global_tracer = LangSmithTracer(
+    if not enabled:
+        logger.info("LangSmith tracing disabled by configuration")
+        _global_tracer = _NOOP_TRACER
+        return _global_tracer
+
+    tracer = LangSmithTracer(
         api_key=api_key,
         project_name=project_name,
         enabled=enabled,
     )
+    # Missing library/key/client all leave the tracer disabled
+    _global_tracer = tracer if tracer.enabled else _NOOP_TRACER
     return _global_tracer
 
 
-def get_tracer() -> Optional[LangSmithTracer]:
+def get_tracer() -> Optional[BaseTracer]:
     """
     Get global LangSmith tracer instance.
 
     Returns:
-        LangSmithTracer instance or None if not initialized
+        Tracer instance or None if not initialized
     """
     return _global_tracer
@@ -4,10 +4,14 @@ Formatting Utilities
 Functions for formatting various data types for display.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_timestamp(
     timestamp: datetime | str | None = None, format_str: str = "%Y-%m-%d %H:%M:%S"
 ) -> str:
@@ -56,13 +60,13 @@ def format_duration(seconds: float) -> str:
         >>> format_duration(3665)
         '1h 1m 5s'
     """
-    if seconds < 60:
-        return f"{int(seconds)}s"
+    total = int(seconds)
+    if total < 60:
+        return f"{total}s"
 
-    delta = timedelta(seconds=int(seconds))
-    hours = delta.seconds // 3600
-    minutes = (delta.seconds % 3600) // 60
-    secs = delta.seconds % 60
+    # Hours are not capped at a day (timedelta.seconds used to drop days)
+    hours, rem = divmod(total, 3600)
+    minutes, secs = divmod(rem, 60)
 
     parts = []
     if hours > 0:
@@ -75,6 +79,7 @@ def format_duration(seconds: float) -> str:
     return " ".join(parts)
 
 
+@lru_cache(maxsize=4096)
 def format_cost(cost: float, currency: str = "$") -> str:
     """
     Format cost in USD.
@@ -117,10 +122,9 @@ def format_token_count(tokens: int) -> str:
     """
     if tokens < 1000:
         return str(tokens)
-    elif tokens < 1_000_000:
+    if tokens < 1_000_000:
         return f"{tokens / 1000:.1f}K"
-    else:
-        return f"{tokens / 1_000_000:.1f}M"
+    return f"{tokens / 1_000_000:.1f}M"
 
 
 def format_percentage(value: float, decimal_places: int = 1) -> str:
@@ -165,15 +169,12 @@ def format_file_size(bytes_size: int) -> str:
         >>> format_file_size(1048576)
         '1.0 MB'
     """
-    units = ["B", "KB", "MB", "GB", "TB"]
-    size = float(bytes_size)
-    unit_index = 0
-
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+    if bytes_size < 1024:
+        return f"{float(bytes_size):.1f} B"
 
-    return f"{size:.1f} {units[unit_index]}"
+    # Each unit is 2**10 larger, so the index falls out of the bit length
+    unit_index = min((int(bytes_size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytes_size / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
 
 
 def format_list(items: list, max_items: int = 5, separator: str = ", ") -> str:
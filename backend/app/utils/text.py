@@ -5,10 +5,25 @@ Common text processing and manipulation functions.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse
 
 
+# ASCII control characters except tab and newline, removed by clean_text
+_CTRL_DELETIONS = dict.fromkeys(
+    [i for i in range(32) if i not in (9, 10)] + [127]
+)
+_MULTI_SPACE = re.compile(r" +")
+_MULTI_NL = re.compile(r"\n{3,}")
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_STOP_WORDS = frozenset({
+    "the", "is", "at", "which", "on", "a", "an", "and", "or", "but",
+    "in", "with", "to", "for", "of", "as", "by", "from", "this", "that"
+})
+
+
 def truncate_text(text: str, max_length: int = 200, suffix: str = "...") -> str:
     """
     Truncate text to maximum length.
@@ -24,10 +39,14 @@ def truncate_text(text: str, max_length: int = 200, suffix: str = "...") -> str:
     if len(text) <= max_length:
         return text
 
-    truncate_at = max_length - len(suffix)
-    return text[:truncate_at].rstrip() + suffix
+    # Walk back over trailing whitespace so the slice is taken only once
+    end = max_length - len(suffix)
+    while end > 0 and text[end - 1].isspace():
+        end -= 1
+    return text[:end] + suffix
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """
     Extract domain from URL.
@@ -66,15 +85,20 @@ def clean_text(text: str, remove_extra_whitespace: bool = True) -> str:
     if not text:
         return ""
 
-    # Remove control characters
-    text = "".join(char for char in text if char.isprintable() or char in "\n\t")
+    # Remove non-printable characters. ASCII text only needs the control
+    # table; anything else goes through isprintable() so format characters
+    # and separators (ZWSP, BOM, soft hyphen, NBSP, U+2028/2029) still go
+    if text.isascii():
+        text = text.translate(_CTRL_DELETIONS)
+    else:
+        text = "".join(char for char in text if char.isprintable() or char in "\n\t")
 
     # Remove extra whitespace if requested
     if remove_extra_whitespace:
         # Replace multiple spaces with single space
-        text = re.sub(r" +", " ", text)
+        text = _MULTI_SPACE.sub(" ", text)
         # Replace multiple newlines with double newline
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _MULTI_NL.sub("\n\n", text)
 
     return text.strip()
 
@@ -112,23 +136,11 @@ def extract_keywords(text: str, max_keywords: int = 10) -> list[str]:
         return []
 
     # Simple extraction: lowercase words, remove common words
-    stop_words = {
-        "the", "is", "at", "which", "on", "a", "an", "and", "or", "but",
-        "in", "with", "to", "for", "of", "as", "by", "from", "this", "that"
-    }
-
-    words = re.findall(r'\b\w+\b', text.lower())
-    keywords = [w for w in words if w not in stop_words and len(w) > 3]
+    words = _WORD_RE.findall(text.lower())
+    keywords = (w for w in words if len(w) > 3 and w not in _STOP_WORDS)
 
     # Get unique keywords maintaining order
-    seen = set()
-    unique_keywords = []
-    for kw in keywords:
-        if kw not in seen:
-            seen.add(kw)
-            unique_keywords.append(kw)
-
-    return unique_keywords[:max_keywords]
+    return list(dict.fromkeys(keywords))[:max_keywords]
 
 
 def split_into_sentences(text: str) -> list[str]:
@@ -145,7 +157,7 @@ def split_into_sentences(text: str) -> list[str]:
         return []
 
     # Simple sentence splitting (improved regex)
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     return [s.strip() for s in sentences if s.strip()]
 
 
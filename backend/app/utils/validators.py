@@ -5,11 +5,19 @@ Functions for validating and sanitizing various inputs.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse
 from pathlib import Path
 
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE
+)
+_APIKEY_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
 def validate_url(url: str, allowed_schemes: Optional[list[str]] = None) -> bool:
     """
     Validate if string is a valid URL.
@@ -32,9 +40,12 @@ def validate_url(url: str, allowed_schemes: Optional[list[str]] = None) -> bool:
     if not url or not isinstance(url, str):
         return False
 
-    if allowed_schemes is None:
-        allowed_schemes = ["http", "https"]
+    schemes = ("http", "https") if allowed_schemes is None else tuple(allowed_schemes)
+    return _validate_url_cached(url, schemes)
 
+
+@lru_cache(maxsize=2048)
+def _validate_url_cached(url: str, allowed_schemes: Tuple[str, ...]) -> bool:
     try:
         parsed = urlparse(url)
         return (
@@ -65,8 +76,12 @@ def validate_email(email: str) -> bool:
         return False
 
     # Simple but robust email regex
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return _match_email(email)
+
+
+@lru_cache(maxsize=2048)
+def _match_email(email: str) -> bool:
+    return bool(_EMAIL_RE.match(email))
 
 
 def sanitize_filename(
@@ -95,11 +110,11 @@ def sanitize_filename(
         return "unnamed"
 
     # Remove invalid filename characters
-    invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-    sanitized = re.sub(invalid_chars, replacement, filename)
+    sanitized = filename.translate(_filename_table(replacement))
 
     # Remove leading/trailing dots and spaces
-    sanitized = sanitized.strip(". ")
+    if sanitized.startswith((".", " ")) or sanitized.endswith((".", " ")):
+        sanitized = sanitized.strip(". ")
 
     # Truncate if too long
     if len(sanitized) > max_length:
@@ -112,6 +127,13 @@ def sanitize_filename(
     return sanitized if sanitized else "unnamed"
 
 
+@lru_cache(maxsize=8)
+def _filename_table(replacement: str) -> Dict[int, str]:
+    """Build the str.translate table mapping invalid filename chars to replacement."""
+    invalid = '<>:"/\\|?*' + "".join(chr(i) for i in range(32))
+    return dict.fromkeys(map(ord, invalid), replacement)
+
+
 def validate_session_id(session_id: str) -> bool:
     """
     Validate session ID format.
@@ -132,8 +154,12 @@ def validate_session_id(session_id: str) -> bool:
         return False
 
     # UUID format (8-4-4-4-12)
-    uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    return bool(re.match(uuid_pattern, session_id, re.IGNORECASE))
+    return _match_session_id(session_id)
+
+
+@lru_cache(maxsize=2048)
+def _match_session_id(session_id: str) -> bool:
+    return bool(_UUID_RE.match(session_id))
 
 
 def validate_api_key(api_key: str, min_length: int = 20) -> bool:
@@ -157,7 +183,7 @@ def validate_api_key(api_key: str, min_length: int = 20) -> bool:
         return False
 
     # Basic checks: alphanumeric + common chars, minimum length
-    return len(api_key) >= min_length and bool(re.match(r'^[A-Za-z0-9_-]+$', api_key))
+    return len(api_key) >= min_length and bool(_APIKEY_RE.match(api_key))
 
 
 def sanitize_query(query: str, max_length: int = 1000) -> str:
@@ -181,7 +207,7 @@ def sanitize_query(query: str, max_length: int = 1000) -> str:
         return ""
 
     # Remove HTML tags
-    query = re.sub(r'<[^>]+>', '', query)
+    query = _strip_tags(query)
 
     # Clean whitespace
     query = " ".join(query.split())
@@ -193,6 +219,37 @@ def sanitize_query(query: str, max_length: int = 1000) -> str:
     return query
 
 
+def _strip_tags(text: str) -> str:
+    """
+    Remove ``<...>`` tags with a linear str.find scan.
+
+    Matches the behaviour of ``re.sub(r'<[^>]+>', '', text)``: empty ``<>``
+    pairs and an unterminated ``<`` are left in place.
+    """
+    if "<" not in text:
+        return text
+
+    out = []
+    i = 0
+    while True:
+        j = text.find("<", i)
+        if j < 0:
+            out.append(text[i:])
+            break
+        out.append(text[i:j])
+        k = text.find(">", j + 1)
+        if k < 0:
+            out.append(text[j:])
+            break
+        if k == j + 1:
+            # "<>" is not a tag; keep the "<" and rescan after it
+            out.append("<")
+            i = j + 1
+            continue
+        i = k + 1
+    return "".join(out)
+
+
 def validate_port(port: int | str) -> bool:
     """
     Validate port number.
@@ -9,20 +9,31 @@ import asyncio
 import sys
 import os
 import logging
+from contextvars import ContextVar
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
+
+# Optional: uvloop gives a faster event loop on Linux/macOS
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.config import load_settings, get_llm_config_dict
 from app.llm import LLMManager
+from app.llm.openai_provider import close_shared_http_client
 from app.agents import ResearcherAgent, EvaluatorAgent
+from app.evaluation import EvaluationPayload
 from app.database import (
     init_database,
     create_session,
     update_session,
     save_trace_event,
+    save_trace_events_bulk,
     save_end_to_end_evaluation,
 )
 
@@ -33,11 +44,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Trace events are queued and written in batches by trace_flusher()
+TRACE_BATCH_SIZE = 32
+_trace_queue: Optional[asyncio.Queue] = None
+
+# The final report is written to stdout in chunks of this many characters
+REPORT_CHUNK_SIZE = 4096
+
+# Session that trace events without an explicit session_id belong to; task-local
+# so concurrent research sessions don't see each other's id
+_current_session_id: ContextVar[Optional[str]] = ContextVar(
+    "current_session_id", default=None
+)
+
 
 async def trace_callback(event_type: str, data: dict, iteration: int = None):
     """
     Callback to save trace events to database.
 
+    Events are queued for the background flusher when it is running,
+    otherwise written directly.
+
     Args:
         event_type: Type of trace event
         data: Event data
@@ -45,21 +72,54 @@ async def trace_callback(event_type: str, data: dict, iteration: int = None):
     """
     try:
         # Extract session_id from data if present
-        session_id = data.get("session_id")
-        if not session_id and hasattr(trace_callback, 'current_session_id'):
-            session_id = trace_callback.current_session_id
-
-        if session_id:
-            await save_trace_event(
-                session_id=session_id,
-                event_type=event_type,
-                data=data,
-                iteration=iteration,
-            )
+        session_id = data.get("session_id") or _current_session_id.get()
+
+        if not session_id:
+            return
+
+        if _trace_queue is not None:
+            _trace_queue.put_nowait({
+                "session_id": session_id,
+                "event_type": event_type,
+                "data": data,
+                "iteration": iteration,
+            })
+            return
+
+        await save_trace_event(
+            session_id=session_id,
+            event_type=event_type,
+            data=data,
+            iteration=iteration,
+        )
     except Exception as e:
         logger.error(f"Failed to save trace event: {e}")
 
 
+async def trace_flusher(queue: asyncio.Queue):
+    """
+    Drain queued trace events into the database in batches.
+
+    Args:
+        queue: Queue filled by trace_callback
+    """
+    while True:
+        events = [await queue.get()]
+        while len(events) < TRACE_BATCH_SIZE:
+            try:
+                events.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        try:
+            await save_trace_events_bulk(events)
+        except Exception as e:
+            logger.error(f"Failed to save {len(events)} trace events: {e}")
+        finally:
+            for _ in events:
+                queue.task_done()
+
+
 async def main():
     """Main application entry point."""
     print("=" * 60)
@@ -85,7 +145,7 @@ async def main():
         print(f"✗ Failed to initialize database: {e}")
         return
 
-    # Initialize LLM Manager
+    # Initialize LLM Manager (providers are built lazily on first use)
     try:
         print("Initializing LLM providers...")
         llm_config = get_llm_config_dict(settings)
@@ -96,24 +156,32 @@ async def main():
         return
 
     # Initialize agents
+    try:
         print("Initializing agents...")
-    researcher = ResearcherAgent(
-        llm_manager=llm_manager,
-        max_iterations=settings.research.max_iterations,
-        timeout_minutes=settings.research.timeout_minutes,
-        trace_callback=trace_callback,
-        tool_settings=settings.tools,
-        llm_temperature=None,
-        policy_overrides={
-            'finish_guard_enabled': settings.research.finish_guard_enabled,
-            'finish_guard_retry_on_auto_finish': settings.research.finish_guard_retry_on_auto_finish,
-            'sparse_result_threshold': settings.research.sparse_result_threshold,
-            'sufficient_result_count': settings.research.sufficient_result_count,
-            'ascii_prompts': settings.research.ascii_prompts,
-        },
-    )
-    evaluator = EvaluatorAgent(llm_manager=llm_manager)
-    print("✓ Agents initialized")
+        researcher = ResearcherAgent(
+            llm_manager=llm_manager,
+            max_iterations=settings.research.max_iterations,
+            timeout_minutes=settings.research.timeout_minutes,
+            trace_callback=trace_callback,
+            tool_settings=settings.tools,
+            llm_temperature=None,
+            policy_overrides={
+                'finish_guard_enabled': settings.research.finish_guard_enabled,
+                'finish_guard_retry_on_auto_finish': settings.research.finish_guard_retry_on_auto_finish,
+                'sparse_result_threshold': settings.research.sparse_result_threshold,
+                'sufficient_result_count': settings.research.sufficient_result_count,
+                'ascii_prompts': settings.research.ascii_prompts,
+            },
+        )
+        evaluator = EvaluatorAgent(llm_manager=llm_manager)
+        print("✓ Agents initialized")
+    except Exception as e:
+        print(f"✗ Failed to initialize agents: {e}")
+        return
+
+    global _trace_queue
+    _trace_queue = asyncio.Queue()
+    flusher_task = asyncio.create_task(trace_flusher(_trace_queue))
 
     print()
     print("=" * 60)
@@ -146,7 +214,7 @@ async def main():
         session_id = session.id
 
         # Set session_id in trace callback
-        trace_callback.current_session_id = session_id
+        _current_session_id.set(session_id)
 
         print(f"Created session: {session_id}")
         print()
@@ -154,9 +222,16 @@ async def main():
         print(f"✗ Failed to create session: {e}")
         session_id = None
 
+    # Warm provider connections and the evaluator prompt's token count
+    # while research runs
+    warmup_task = asyncio.create_task(
+        llm_manager.warmup([EvaluatorAgent.END_TO_END_PROMPT])
+    )
+
     # Perform research
     try:
         result = await researcher.research(query, session_id=session_id)
+        await warmup_task
 
         print()
         print("=" * 60)
@@ -174,17 +249,18 @@ async def main():
         # Update database session
         if session_id:
             try:
-                await update_session(
-                    session_id=session_id,
-                    status=result.status,
-                    completed_at=datetime.utcnow(),
-                    total_duration_seconds=result.total_duration_seconds,
-                    total_iterations=result.total_iterations,
-                    total_cost_usd=result.total_cost_usd,
-                    total_tokens=result.total_tokens,
-                    final_report=result.report,
-                    sources=result.sources,
-                )
+                payload = {
+                    "status": result.status,
+                    # Columns store naive UTC timestamps
+                    "completed_at": datetime.now(timezone.utc).replace(tzinfo=None),
+                    "total_duration_seconds": result.total_duration_seconds,
+                    "total_iterations": result.total_iterations,
+                    "total_cost_usd": result.total_cost_usd,
+                    "total_tokens": result.total_tokens,
+                    "final_report": result.report,
+                    "sources": result.sources,
+                }
+                await update_session(session_id, payload)
                 print(f"Session updated in database: {session_id}")
                 print()
             except Exception as e:
@@ -195,8 +271,13 @@ async def main():
             print("FINAL REPORT")
             print("=" * 60)
             print()
-            print(result.report)
-            print()
+            # Write the report in chunks rather than one large print()
+            report = result.report
+            write = sys.stdout.write
+            for start in range(0, len(report), REPORT_CHUNK_SIZE):
+                write(report[start:start + REPORT_CHUNK_SIZE])
+            write("\n\n")
+            sys.stdout.flush()
 
         # Perform evaluation
         if result.status == "completed":
@@ -212,30 +293,25 @@ async def main():
             print()
 
             end_eval = eval_result.end_to_end_evaluation
-            print("Quality Scores (0-1 scale):")
-            print(f"  - Relevance: {end_eval.relevance_score:.2f}")
-            print(f"  - Accuracy: {end_eval.accuracy_score:.2f}")
-            print(f"  - Completeness: {end_eval.completeness_score:.2f}")
-            print(f"  - Source Quality: {end_eval.source_quality_score:.2f}")
-            print()
-
-            if end_eval.strengths:
-                print("Strengths:")
-                for strength in end_eval.strengths:
-                    print(f"  • {strength}")
-                print()
-
-            if end_eval.weaknesses:
-                print("Weaknesses:")
-                for weakness in end_eval.weaknesses:
-                    print(f"  • {weakness}")
-                print()
-
-            if end_eval.recommendations:
-                print("Recommendations:")
-                for rec in end_eval.recommendations:
-                    print(f"  • {rec}")
-                print()
+            # Build the evaluation summary once and print it in one write
+            lines = [
+                "Quality Scores (0-1 scale):",
+                f"  - Relevance: {end_eval.relevance_score:.2f}",
+                f"  - Accuracy: {end_eval.accuracy_score:.2f}",
+                f"  - Completeness: {end_eval.completeness_score:.2f}",
+                f"  - Source Quality: {end_eval.source_quality_score:.2f}",
+                "",
+            ]
+            for heading, items in (
+                ("Strengths:", end_eval.strengths),
+                ("Weaknesses:", end_eval.weaknesses),
+                ("Recommendations:", end_eval.recommendations),
+            ):
+                if items:
+                    lines.append(heading)
+                    lines.extend(f"  • {item}" for item in items)
+                    lines.append("")
+            print("\n".join(lines))
 
             # Save evaluation to database
             if session_id:
@@ -243,17 +319,7 @@ async def main():
                     # Save end-to-end evaluation (0-1 scale, 4 metrics only)
                     await save_end_to_end_evaluation(
                         session_id=session_id,
-                        evaluation={
-                            "relevance_score": end_eval.relevance_score,
-                            "accuracy_score": end_eval.accuracy_score,
-                            "completeness_score": end_eval.completeness_score,
-                            "source_quality_score": end_eval.source_quality_score,
-                            "strengths": end_eval.strengths,
-                            "weaknesses": end_eval.weaknesses,
-                            "recommendations": end_eval.recommendations,
-                            "tokens_used": end_eval.tokens_used,
-                            "cost_usd": end_eval.cost_usd,
-                        }
+                        evaluation=EvaluationPayload.from_evaluation(end_eval),
                     )
 
                     print(f"Evaluations saved to database: {session_id}")
@@ -266,9 +332,18 @@ async def main():
         import traceback
         traceback.print_exc()
 
+    # Write out any trace events still queued before exiting
+    await _trace_queue.join()
+    flusher_task.cancel()
+    warmup_task.cancel()
+    await close_shared_http_client()
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
 
 
@@ -5,8 +5,27 @@ Tests each provider independently and failover behavior.
 
 import asyncio
 import os
+from contextlib import contextmanager
 from app.tools.web_search import web_search
 
+@contextmanager
+def env_patch(**overrides):
+    """Temporarily set (or, with None, remove) environment variables."""
+    saved = {key: os.environ.get(key) for key in overrides}
+    for key, value in overrides.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
 async def test_provider_order():
     """Test that providers are tried in correct order."""
     print("\n=== Test 1: Provider Order ===")
@@ -33,21 +52,13 @@ async def test_tavily_only():
     print("\n=== Test 2: Tavily Only ===")
 
     # Temporarily clear other keys
-    serper_backup = os.environ.pop("SERPER_API_KEY", None)
-    serpapi_backup = os.environ.pop("SERPAPI_API_KEY", None)
-
-    result = await web_search("AI news", num_results=3)
+    with env_patch(SERPER_API_KEY=None, SERPAPI_API_KEY=None):
+        result = await web_search("AI news", num_results=3)
 
     print(f"Provider: {result['provider']}")
     assert result['provider'] == 'tavily' or result['provider'] == 'none', \
         f"Expected tavily, got {result['provider']}"
 
-    # Restore keys
-    if serper_backup:
-        os.environ["SERPER_API_KEY"] = serper_backup
-    if serpapi_backup:
-        os.environ["SERPAPI_API_KEY"] = serpapi_backup
-
     print("SUCCESS: Tavily-only test passed")
 
 async def test_failover():
@@ -55,10 +66,8 @@ async def test_failover():
     print("\n=== Test 3: Failover Behavior ===")
 
     # Use invalid Tavily key to force failover
-    tavily_backup = os.environ.get("TAVILY_API_KEY")
-    os.environ["TAVILY_API_KEY"] = "invalid_key"
-
-    result = await web_search("machine learning", num_results=3)
+    with env_patch(TAVILY_API_KEY="invalid_key"):
+        result = await web_search("machine learning", num_results=3)
 
     print(f"Provider: {result['provider']}")
     print(f"Status: {result['status']}")
@@ -67,10 +76,6 @@ async def test_failover():
     assert result['provider'] in ['serper', 'serpapi', 'none'], \
         f"Expected fallback provider, got {result['provider']}"
 
-    # Restore key
-    if tavily_backup:
-        os.environ["TAVILY_API_KEY"] = tavily_backup
-
     print("SUCCESS: Failover test passed")
 
 async def test_date_filter():
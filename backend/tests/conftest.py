@@ -0,0 +1,58 @@
+"""
+Shared pytest configuration for backend tests.
+
+Installs the smoke-check dependency stubs once per session rather than on
+every run of the smoke module, and holds the session-wide in-memory test
+database.
+"""
+
+import asyncio
+import sys
+
+import pytest
+import pytest_asyncio
+
+from smoke_stubs import install_smoke_stubs
+
+# Optional: uvloop gives a faster event loop on Linux/macOS
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Named shared-cache in-memory SQLite: every pooled connection sees the
+# same database, so the schema is created once per test session
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file:memdb?mode=memory&cache=shared&uri=true"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def smoke_stubs():
+    """Install smoke-check stubs once per test session."""
+    install_smoke_stubs()
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the one session-scoped event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests (and the validation suite) on uvloop when installed."""
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+async def database():
+    """Initialize the shared in-memory database once per test session."""
+    pytest.importorskip("aiosqlite")
+    from app.database import database as database_module
+
+    await database_module.init_database(TEST_DATABASE_URL, echo=False)
+    yield database_module
+    await database_module.close_database()
@@ -8,66 +8,26 @@ These checks verify:
 """
 
 import asyncio
+import importlib
 import os
 import sys
-import types
+from pathlib import Path
 from unittest.mock import patch
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-def _install_httpx_stub():
-    if "httpx" in sys.modules:
-        return
-
-    class _StubAsyncClient:
-        def __init__(self, *_, **__):
-            pass
-
-        async def post(self, *args, **kwargs):  # pragma: no cover - stub only
-            raise NotImplementedError("httpx stub: post() should be patched in tests")
-
-        async def aclose(self):
-            return None
-
-    class _HTTPStatusError(Exception):
-        def __init__(self, message, request=None, response=None):
-            super().__init__(message)
-            self.request = request
-            self.response = response
-
-    stub = types.ModuleType("httpx")
-    stub.AsyncClient = _StubAsyncClient
-    stub.HTTPStatusError = _HTTPStatusError
-    stub.TimeoutException = Exception
-    sys.modules["httpx"] = stub
-
+# Make the backend package and the shared stubs importable when run directly
+TESTS_DIR = Path(__file__).resolve().parent
+for path in (TESTS_DIR.parent, TESTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
 
-def _install_provider_stub(module_name: str):
-    if module_name in sys.modules:
-        return
-    module = types.ModuleType(module_name)
-
-    class _Placeholder:
-        def __init__(self, *_, **__):
-            pass
-
-    attr_name = module_name.split(".")[-1].replace("_provider", "").capitalize() + "Provider"
-    setattr(module, attr_name, _Placeholder)
-
-    # Preserve canonical class names expected by imports
-    if "openai" in module_name:
-        module.OpenAIProvider = _Placeholder  # type: ignore[attr-defined]
-    if "gemini" in module_name:
-        module.GeminiProvider = _Placeholder  # type: ignore[attr-defined]
-    sys.modules[module_name] = module
+from smoke_stubs import install_smoke_stubs  # noqa: E402
 
-
-_install_httpx_stub()
-_install_provider_stub("app.llm.openai_provider")
-_install_provider_stub("app.llm.gemini_provider")
-if "arxiv" not in sys.modules:
-    sys.modules["arxiv"] = types.ModuleType("arxiv")
-
-import importlib
+install_smoke_stubs()
 
 web_search_module = importlib.import_module("app.tools.web_search")  # noqa: E402
 from app.llm.manager import LLMManager  # noqa: E402
@@ -200,11 +160,17 @@ async def check_openrouter_model_fallback():
 
 
 async def main():
-    await check_web_search_failover()
-    await check_llm_manager_content_requirement()
-    await check_openrouter_model_fallback()
+    # The checks patch disjoint targets, so they can run concurrently
+    await asyncio.gather(
+        check_web_search_failover(),
+        check_llm_manager_content_requirement(),
+        check_openrouter_model_fallback(),
+    )
     print("✅ Backend smoke checks passed")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -0,0 +1,28 @@
+from app.llm.gemini_provider import GeminiProvider
+
+
+def test_clean_schema_strips_unsupported_fields_and_reuses_result():
+    provider = GeminiProvider.__new__(GeminiProvider)
+    schema = {
+        "type": "object",
+        "properties": {
+            "num_results": {"type": "integer", "default": 10, "minimum": 1},
+            "date_filter": {"type": "string", "enum": ["day", "week", None]},
+        },
+        "required": ["num_results"],
+        "additionalProperties": False,
+    }
+
+    cleaned = provider._clean_schema_for_gemini(schema)
+
+    assert cleaned == {
+        "type": "object",
+        "properties": {
+            "num_results": {"type": "integer"},
+            "date_filter": {"type": "string", "enum": ["day", "week"]},
+        },
+        "required": ["num_results"],
+    }
+    assert list(cleaned["properties"]) == ["num_results", "date_filter"]
+    assert provider._clean_schema_for_gemini(dict(schema)) is cleaned
+    assert schema["properties"]["num_results"]["default"] == 10
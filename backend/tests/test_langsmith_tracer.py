@@ -0,0 +1,186 @@
+import threading
+import time
+import uuid
+
+import pytest
+
+from app.tracing import langsmith as langsmith_module
+
+
+class FakeRun:
+    calls = []
+    lock = threading.Lock()
+
+    def __init__(self, name, parent_run=None, extra=None, **_):
+        self.id = uuid.uuid4()
+        self.name = name
+        self.extra = extra or {}
+
+    def _record(self, op):
+        with FakeRun.lock:
+            FakeRun.calls.append((self.name, op))
+
+    def post(self):
+        time.sleep(0.05)  # Slow upload must still land before the patch
+        self._record("post")
+
+    def patch(self):
+        self._record("patch")
+
+    def end(self, outputs=None, error=None):
+        self.outputs = outputs
+
+
+@pytest.fixture
+def make_tracer(monkeypatch):
+    FakeRun.calls = []
+    monkeypatch.setattr(langsmith_module, "RunTree", FakeRun)
+    monkeypatch.setattr(langsmith_module, "Client", lambda **_: object())
+    monkeypatch.setenv("LANGSMITH_API_KEY", "test-key")
+    monkeypatch.setenv("LANGSMITH_PROJECT", "test-project")
+
+    tracers = []
+
+    def factory(**kwargs):
+        kwargs.setdefault("flush_interval", 60)
+        tracer = langsmith_module.LangSmithTracer(
+            api_key="test-key", project_name="test", **kwargs
+        )
+        tracers.append(tracer)
+        return tracer
+
+    yield factory
+    for tracer in tracers:
+        tracer.shutdown()
+
+
+@pytest.fixture
+def tracer(make_tracer):
+    return make_tracer()
+
+
+def test_tracer_uploads_in_background_and_preserves_order(tracer):
+    started = time.perf_counter()
+    parent_id = tracer.start_run("parent")
+    child_id = tracer.start_run("child", parent_run_id=parent_id)
+    tracer.log_event(child_id, "note", {"value": 1})
+    tracer.end_run(child_id, outputs={"ok": True})
+    tracer.end_run(parent_id, outputs={"ok": True})
+    assert time.perf_counter() - started < 0.05
+
+    tracer.flush()
+
+    parent_ops = [op for name, op in FakeRun.calls if name == "parent"]
+    child_ops = [op for name, op in FakeRun.calls if name == "child"]
+    assert parent_ops == ["post", "patch"]
+    assert child_ops == ["post", "patch"]
+    assert FakeRun.calls.index(("parent", "post")) < FakeRun.calls.index(("child", "post"))
+
+
+def test_tracer_coalesces_logged_events_into_one_patch(tracer):
+    run_id = tracer.start_run("run")
+    run = tracer.active_runs[run_id]
+    for i in range(5):
+        tracer.log_event(run_id, "step", {"i": i})
+
+    tracer.flush()
+    tracer.log_event(run_id, "step", {"i": 5})
+    tracer.end_run(run_id)
+    tracer.flush()
+
+    assert [op for _, op in FakeRun.calls] == ["post", "patch", "patch"]
+    assert [event["data"]["i"] for event in run.extra["events"]] == list(range(6))
+
+
+def test_tracer_reuses_duplicate_runs_within_ttl(make_tracer):
+    tracer = make_tracer(cache_ttl_seconds=30)
+
+    first = tracer.trace_research_session("s1", "what is rag?")
+    second = tracer.trace_research_session("s1", "what is rag?")
+    other = tracer.trace_research_session("s1", "what is a vector db?")
+    tracer.flush()
+
+    assert first == second
+    assert other != first
+    assert [op for _, op in FakeRun.calls] == ["post", "post"]
+
+
+def test_tracer_shares_duplicate_run_until_every_caller_ends_it(make_tracer):
+    tracer = make_tracer(cache_ttl_seconds=30)
+
+    first = tracer.trace_research_session("s1", "what is rag?")
+    second = tracer.trace_research_session("s1", "what is rag?")
+    tracer.end_run(first)
+
+    # Still open for the second caller
+    assert second in tracer.active_runs
+    tracer.end_run(second)
+    assert second not in tracer.active_runs
+
+    # An ended run is never handed out again
+    third = tracer.trace_research_session("s1", "what is rag?")
+    tracer.flush()
+
+    assert third != first
+    assert [op for _, op in FakeRun.calls] == ["post", "patch", "post"]
+
+
+def test_init_langsmith_returns_noop_tracer_when_disabled():
+    tracer = langsmith_module.init_langsmith(enabled=False)
+
+    assert isinstance(tracer, langsmith_module.BaseTracer)
+    assert not tracer.enabled
+    assert tracer.start_run("run", inputs={"q": 1}) is None
+    assert tracer.trace_research_session("s1", "query") is None
+    with tracer.trace_context("block") as run_id:
+        assert run_id is None
+
+
+def test_tracer_drops_only_event_flushes_beyond_in_flight_limit(make_tracer):
+    tracer = make_tracer(max_in_flight=1)
+
+    run_ids = [tracer.start_run(f"run-{i}") for i in range(3)]
+    for run_id in run_ids:
+        tracer.log_event(run_id, "note", {"value": 1})
+    # run-0's flush is still queued behind its slow post, so the rest drop
+    tracer._flush_events()
+    for run_id in run_ids:
+        tracer.end_run(run_id)
+    tracer.flush()
+
+    assert [op for name, op in FakeRun.calls if name == "run-0"] == ["post", "patch", "patch"]
+    assert [op for name, op in FakeRun.calls if name == "run-1"] == ["post", "patch"]
+    assert [op for name, op in FakeRun.calls if name == "run-2"] == ["post", "patch"]
+    assert tracer._dropped == 2
+
+
+class FakeAsyncClient:
+    def __init__(self, **_):
+        self.calls = []
+
+    async def create_run(self, name, inputs, run_type, **kwargs):
+        self.calls.append(("create", name, kwargs.get("parent_run_id")))
+
+    async def update_run(self, run_id, **kwargs):
+        self.calls.append(("update", str(run_id), kwargs.get("extra")))
+
+    async def aclose(self):
+        pass
+
+
+async def test_async_tracer_awaits_client_calls(monkeypatch):
+    from app.tracing import async_langsmith
+
+    monkeypatch.setattr(async_langsmith, "AsyncClient", FakeAsyncClient)
+    tracer = async_langsmith.AsyncLangSmithTracer(api_key="test-key", project_name="test")
+    client = tracer.client
+
+    async with tracer.trace_context("session") as run_id:
+        tracer.log_event(run_id, "note", {"value": 1})
+        child_id = await tracer.start_run("child", parent_run_id=run_id)
+        await tracer.end_run(child_id)
+    await tracer.aclose()
+
+    assert [call[0] for call in client.calls] == ["create", "create", "update", "update"]
+    assert str(client.calls[1][2]) == run_id
+    assert client.calls[3][2]["events"][0]["data"] == {"value": 1}
@@ -1,5 +1,3 @@
-import pytest
-
 from app.llm.manager import LLMManager
 
 
@@ -13,6 +11,9 @@ class _BaseStubProvider:
     def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
         return 0.0
 
+    async def warmup(self) -> None:
+        pass
+
 
 class EmptyProvider(_BaseStubProvider):
     async def complete(self, messages, tools, temperature, max_tokens, tool_choice=None):
@@ -36,7 +37,6 @@ class GoodProvider(_BaseStubProvider):
         }
 
 
-@pytest.mark.asyncio
 async def test_llm_manager_falls_back_when_content_empty(monkeypatch):
     monkeypatch.setenv("OPENAI_API_KEY", "test-openai")
     monkeypatch.setenv("GOOGLE_API_KEY", "test-gemini")
@@ -62,3 +62,33 @@ async def test_llm_manager_falls_back_when_content_empty(monkeypatch):
 
     assert response["content"] == "ok"
     assert response["provider_used"] == "gemini"
+
+
+async def test_llm_manager_builds_providers_on_first_use(monkeypatch):
+    built = []
+
+    class RecordingProvider(GoodProvider):
+        def __init__(self, *_, model=None, **__):
+            built.append(model)
+
+    monkeypatch.setattr("app.llm.manager.OpenAIProvider", RecordingProvider)
+    monkeypatch.setattr("app.llm.manager.GeminiProvider", RecordingProvider)
+
+    manager = LLMManager(
+        {
+            "primary": "openai",
+            "fallback_order": ["gemini"],
+            "openai": {"api_key": "test-openai", "model": "primary"},
+            "gemini": {"api_key": "test-gemini", "model": "fallback"},
+        }
+    )
+    assert built == []
+
+    # Warmup only builds the primary; fallbacks stay lazy
+    await manager.warmup(["static prompt"])
+    assert built == ["primary"]
+
+    await manager.complete(messages=[{"role": "user", "content": "test"}])
+    await manager.complete(messages=[{"role": "user", "content": "again"}])
+
+    assert built == ["primary"]
@@ -0,0 +1,236 @@
+import importlib.util
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.llm import openai_provider
+from app.llm.openai_provider import OpenAIProvider
+
+
+def _chat_body(content: str):
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+    }
+
+
+async def test_complete_batch_submits_jsonl_and_restores_order(monkeypatch):
+    # tiktoken downloads encodings on first use; keep this offline
+    monkeypatch.setattr(
+        openai_provider.tiktoken, "encoding_for_model", lambda model: SimpleNamespace()
+    )
+    monkeypatch.setattr(openai_provider, "BATCH_POLL_INITIAL_SECONDS", 0)
+    provider = OpenAIProvider(api_key="test-key", model="gpt-4o-mini")
+
+    output_lines = [
+        {"custom_id": "1", "response": {"status_code": 200, "body": _chat_body("second")}},
+        {"custom_id": "0", "response": {"status_code": 200, "body": _chat_body("first")}},
+    ]
+    uploaded = {}
+
+    async def create_file(file, purpose):
+        uploaded["lines"] = [json.loads(line) for line in file[1].decode().splitlines()]
+        return SimpleNamespace(id="file-in")
+
+    finished = SimpleNamespace(
+        id="batch-1", status="completed", output_file_id="file-out", error_file_id=None
+    )
+    provider.client = SimpleNamespace(
+        files=SimpleNamespace(
+            create=AsyncMock(side_effect=create_file),
+            content=AsyncMock(return_value=SimpleNamespace(
+                text="\n".join(json.dumps(line) for line in output_lines)
+            )),
+        ),
+        batches=SimpleNamespace(
+            create=AsyncMock(return_value=SimpleNamespace(id="batch-1", status="validating")),
+            retrieve=AsyncMock(return_value=finished),
+        ),
+    )
+
+    results = await provider.complete_batch([
+        {"messages": [{"role": "user", "content": "a"}], "max_tokens": 10},
+        {"messages": [{"role": "user", "content": "b"}], "max_tokens": 10},
+    ])
+
+    assert [line["url"] for line in uploaded["lines"]] == ["/v1/chat/completions"] * 2
+    assert uploaded["lines"][1]["body"]["messages"][0]["content"] == "b"
+    assert [result["content"] for result in results] == ["first", "second"]
+    assert results[0]["usage"]["total_tokens"] == 5
+
+
+def test_responses_input_converts_only_appended_messages(monkeypatch):
+    monkeypatch.setattr(
+        openai_provider.tiktoken, "encoding_for_model", lambda model: SimpleNamespace()
+    )
+    provider = OpenAIProvider(api_key="test-key", model="gpt-5-nano")
+    history = [
+        {"role": "system", "content": "sys"},
+        {"role": "assistant", "content": "", "tool_calls": [
+            {"id": "call 1", "function": {"name": "web_search", "arguments": "{}"}},
+        ]},
+    ]
+    first = provider._to_responses_input(history)
+
+    converted = []
+    original = provider._extend_responses_input
+
+    def recording_extend(messages, inputs, call_id_map):
+        converted.extend(messages)
+        return original(messages, inputs, call_id_map)
+
+    monkeypatch.setattr(provider, "_extend_responses_input", recording_extend)
+    history.append({"role": "tool", "tool_call_id": "call 1", "content": "result"})
+    second = provider._to_responses_input(history)
+
+    assert converted == history[2:]
+    assert second[:len(first)] == first and len(first) == 2
+    assert second[-1] == {"type": "function_call_output", "call_id": "call_1", "output": "result"}
+    # An edited history is converted from scratch
+    assert provider._to_responses_input(history[1:])[0]["type"] == "function_call"
+
+
+def test_parse_responses_output_reads_text_and_function_calls(monkeypatch):
+    monkeypatch.setattr(
+        openai_provider.tiktoken, "encoding_for_model", lambda model: SimpleNamespace()
+    )
+    provider = OpenAIProvider(api_key="test-key", model="gpt-5-nano")
+    response = SimpleNamespace(
+        output=[
+            SimpleNamespace(type="reasoning", summary=[]),
+            SimpleNamespace(type="message", content=[
+                SimpleNamespace(type="output_text", text="hello"),
+                SimpleNamespace(type="refusal", refusal="no"),
+            ]),
+            SimpleNamespace(
+                type="function_call", id="fc_1", call_id="call_1",
+                name="web_search", arguments='{"query": "rag"}',
+            ),
+            SimpleNamespace(type="message"),  # Malformed item is skipped
+        ],
+        output_text="hello",
+    )
+
+    content, tool_calls = provider._parse_responses_output(response)
+
+    assert content == "hello"
+    assert tool_calls == [{
+        "id": "fc_1",
+        "type": "function",
+        "function": {"name": "web_search", "arguments": '{"query": "rag"}'},
+    }]
+
+
+async def test_complete_is_bound_to_the_models_api(monkeypatch):
+    monkeypatch.setattr(
+        openai_provider.tiktoken, "encoding_for_model", lambda model: SimpleNamespace()
+    )
+    chat = OpenAIProvider(api_key="test-key", model="gpt-4o-mini")
+    responses = OpenAIProvider(api_key="test-key", model="gpt-5-nano")
+    chat._send_chat = AsyncMock(return_value=SimpleNamespace(
+        choices=[SimpleNamespace(
+            message=SimpleNamespace(content="hi", tool_calls=None),
+            finish_reason="stop",
+        )],
+        usage=SimpleNamespace(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+    ))
+
+    assert chat.complete == chat._complete_chat_completions
+    assert responses.complete == responses._complete_responses_api
+
+    result = await chat.complete([{"role": "user", "content": "hi"}])
+
+    assert result["content"] == "hi"
+    assert "input" not in chat._send_chat.call_args.args[0]
+
+
+def test_responses_tools_are_converted_once_per_list(monkeypatch):
+    monkeypatch.setattr(
+        openai_provider.tiktoken, "encoding_for_model", lambda model: SimpleNamespace()
+    )
+    provider = OpenAIProvider(api_key="test-key", model="gpt-5-nano")
+    tools = [{"type": "function", "function": {"name": "finish", "parameters": {}}}]
+
+    first = provider._convert_tools_for_responses(tools)
+
+    assert provider._convert_tools_for_responses(tools) is first
+    assert provider._convert_tools_for_responses(list(tools)) is not first
+    assert first[0]["name"] == "finish"
+
+
+async def test_responses_body_is_sent_pre_encoded(monkeypatch):
+    if not openai_provider._PREENCODED_BODIES:
+        pytest.skip("orjson not installed or SDK lacks post(content=...)")
+    monkeypatch.setattr(
+        openai_provider.tiktoken, "encoding_for_model", lambda model: SimpleNamespace()
+    )
+    monkeypatch.setattr(
+        openai_provider.json, "dumps", lambda *a, **k: pytest.fail("json.dumps used")
+    )
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={
+            "id": "resp_1", "object": "response", "created_at": 0,
+            "model": "gpt-5-nano", "status": "completed", "tools": [],
+            "tool_choice": "auto", "parallel_tool_calls": True,
+            "output": [{
+                "type": "message", "id": "msg_1", "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": "hi", "annotations": []}],
+            }],
+        })
+
+    provider = OpenAIProvider(
+        api_key="test-key",
+        model="gpt-5-nano",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    try:
+        result = await provider.complete([{"role": "user", "content": "héllo"}])
+    finally:
+        await provider.close()
+
+    assert result["content"] == "hi"
+    body = json.loads(requests[0].content)
+    assert requests[0].url.path.endswith("/responses")
+    assert body["model"] == "gpt-5-nano"
+    assert body["input"][0]["content"][0]["text"] == "héllo"
+
+
+
+async def test_build_http_client_passes_http2_only_to_httpx(monkeypatch):
+    # Without aiohttp the SDK's aiohttp client raises and httpx is used
+    if importlib.util.find_spec("aiohttp") is not None:
+        pytest.skip("aiohttp installed; httpx fallback is not used")
+    client = openai_provider._build_http_client()
+    try:
+        pool = client._transport._pool
+        assert isinstance(client, openai_provider.DefaultAsyncHttpxClient)
+        assert pool._max_connections == 20
+        assert pool._max_keepalive_connections == 10
+    finally:
+        await client.aclose()
+
+    built = {}
+    monkeypatch.setattr(
+        openai_provider, "DefaultAioHttpClient", lambda **kwargs: built.update(kwargs)
+    )
+    openai_provider._build_http_client()
+
+    assert built == {"limits": openai_provider.LLM_HTTP_LIMITS}
@@ -1,25 +1,35 @@
-import asyncio
-from types import SimpleNamespace
+import json
 
+import httpx
 import pytest
 
 from app.llm.openrouter_provider import OpenRouterProvider
 
+COMPLETIONS_URL = "https://openrouter.ai/api/v1/chat/completions"
 
-class DummyResponse:
-    def __init__(self, payload, status_code=200):
-        self._payload = payload
-        self.status_code = status_code
-        self.text = ""
 
-    def raise_for_status(self):
-        if self.status_code >= 400:
-            from httpx import HTTPStatusError
+@pytest.fixture
+async def make_provider():
+    """Build providers whose HTTP client is served by an in-process handler."""
+    providers = []
 
-            raise HTTPStatusError("error", request=None, response=self)
+    def factory(handler):
+        provider = OpenRouterProvider(
+            api_key="test-key",
+            model="model-a",
+            alternate_models=["model-b"],
+        )
+        provider.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        providers.append(provider)
+        return provider
+
+    yield factory
+    for provider in providers:
+        await provider.close()
 
-    def json(self):
-        return self._payload
+
+def _requested_models(requests):
+    return [json.loads(request.content)["model"] for request in requests]
 
 
 def _build_payload(content: str):
@@ -34,20 +44,16 @@ def _build_payload(content: str):
     }
 
 
-@pytest.mark.asyncio
-async def test_openrouter_falls_back_to_alternate_model(monkeypatch):
-    provider = OpenRouterProvider(
-        api_key="test-key",
-        model="model-a",
-        alternate_models=["model-b"],
-    )
+async def test_openrouter_falls_back_to_alternate_model(make_provider):
+    requests = []
 
-    async def fake_post(_url, _headers, json):
-        if json["model"] == "model-a":
-            raise Exception("primary failed")
-        return DummyResponse(_build_payload("secondary"))
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(500, text="primary failed")
+        return httpx.Response(200, json=_build_payload("secondary"))
 
-    provider.client.post = fake_post
+    provider = make_provider(handler)
 
     response = await provider.complete(
         messages=[{"role": "user", "content": "hi"}],
@@ -58,22 +64,19 @@ async def test_openrouter_falls_back_to_alternate_model(monkeypatch):
 
     assert response["model"] == "model-b"
     assert response["content"] == "secondary"
+    assert _requested_models(requests) == ["model-a", "model-b"]
+    assert str(requests[0].url) == COMPLETIONS_URL
+    assert requests[0].headers["Authorization"] == "Bearer test-key"
 
-    await provider.close()
 
+async def test_openrouter_raises_when_all_models_fail(make_provider):
+    requests = []
 
-@pytest.mark.asyncio
-async def test_openrouter_raises_when_all_models_fail(monkeypatch):
-    provider = OpenRouterProvider(
-        api_key="test-key",
-        model="model-a",
-        alternate_models=["model-b"],
-    )
-
-    async def fake_post(*args, **kwargs):
-        raise Exception("unavailable")
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503, text="unavailable")
 
-    provider.client.post = fake_post
+    provider = make_provider(handler)
 
     with pytest.raises(Exception):
         await provider.complete(
@@ -82,5 +85,29 @@ async def test_openrouter_raises_when_all_models_fail(monkeypatch):
             temperature=0.2,
             max_tokens=10,
         )
+    assert len(requests) == len(provider.model_priority)
+
+
+async def test_openrouter_skips_tripped_model_without_request(make_provider):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if json.loads(request.content)["model"] == "model-a":
+            return httpx.Response(500, text="primary failed")
+        return httpx.Response(200, json=_build_payload("secondary"))
+
+    provider = make_provider(handler)
+
+    for _ in range(provider.model_failure_threshold + 1):
+        response = await provider.complete(
+            messages=[{"role": "user", "content": "hi"}],
+            tools=None,
+            temperature=0.2,
+            max_tokens=10,
+        )
+        assert response["model"] == "model-b"
 
-    await provider.close()
+    attempted = _requested_models(requests)
+    assert attempted.count("model-a") == provider.model_failure_threshold
+    assert attempted[-1] == "model-b"
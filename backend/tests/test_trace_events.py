@@ -0,0 +1,51 @@
+from app.database import database as database_module
+
+
+def _event(session_id, iteration=1):
+    return {
+        "session_id": session_id,
+        "event_type": "tool_call",
+        "data": {"tool": "web_search", "args": {"query": "rag"}},
+        "iteration": iteration,
+    }
+
+
+async def test_bulk_trace_save_stores_duplicates_as_references(tmp_path):
+    await database_module.init_database(f"sqlite+aiosqlite:///{tmp_path / 'trace.db'}")
+    try:
+        session = await database_module.create_session(None, "query", {})
+        event = _event(session.id)
+
+        saved_first = await database_module.save_trace_events_bulk([event, dict(event)])
+        saved_again = await database_module.save_trace_events_bulk([
+            dict(event),
+            _event(session.id, iteration=2),
+        ])
+        async with await database_module.get_database() as db:
+            stored = (await db.execute(
+                database_module.select(database_module.TraceEvent.data)
+                .order_by(database_module.TraceEvent.id)
+            )).scalars().all()
+        trace = await database_module.get_session_trace(session.id)
+    finally:
+        await database_module.close_database()
+
+    assert (saved_first, saved_again) == (2, 2)
+    assert [row.iteration for row in trace] == [1, 1, 1, 2]
+    assert all(row.data == event["data"] for row in trace)
+    # Repeats only hold a pointer to the first copy
+    assert sum(data == event["data"] for data in stored) == 2
+    assert stored.count({database_module.TRACE_REF_KEY: trace[0].id}) == 2
+
+
+async def test_trace_dedup_does_not_outlive_the_database(tmp_path):
+    for name in ("first.db", "second.db"):
+        await database_module.init_database(f"sqlite+aiosqlite:///{tmp_path / name}")
+        try:
+            session = await database_module.create_session("s1", "query", {})
+            await database_module.save_trace_events_bulk([_event(session.id)])
+            trace = await database_module.get_session_trace(session.id)
+        finally:
+            await database_module.close_database()
+
+        assert [row.data for row in trace] == [_event(session.id)["data"]]
@@ -1,20 +1,27 @@
 import asyncio
+import importlib
+from types import SimpleNamespace
 from typing import List, Dict
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from app.tools import web_search as web_search_module
+web_search_module = importlib.import_module("app.tools.web_search")
 
 
-@pytest.mark.asyncio
-async def test_web_search_prefers_primary_provider(monkeypatch):
-    monkeypatch.setenv("TAVILY_API_KEY", "primary-key")
-    monkeypatch.setenv("SERPER_API_KEY", "secondary-key")
-    monkeypatch.setenv("SERPAPI_API_KEY", "tertiary-key")
+@pytest.fixture(autouse=True, scope="module")
+def _web_search_env():
+    """Configure all three providers once for the module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TAVILY_API_KEY", "primary-key")
+        mp.setenv("SERPER_API_KEY", "secondary-key")
+        mp.setenv("SERPAPI_API_KEY", "tertiary-key")
+        yield
+
 
-    async def fake_tavily(query: str, num_results: int, date_filter, api_key: str):
-        assert api_key == "primary-key"
-        return [
+async def test_web_search_prefers_primary_provider(monkeypatch):
+    fake_tavily = AsyncMock(
+        return_value=[
             {
                 "title": "Primary result",
                 "snippet": "Example",
@@ -25,27 +32,20 @@ async def test_web_search_prefers_primary_provider(monkeypatch):
                 "content_type": "web_page",
             }
         ]
-
+    )
     monkeypatch.setattr(web_search_module, "_search_tavily", fake_tavily)
 
     result = await web_search_module.web_search("test query", num_results=1)
 
     assert result["provider"] == "tavily"
     assert result["total_found"] == 1
+    fake_tavily.assert_awaited_once_with("test query", 1, None, "primary-key")
 
 
-@pytest.mark.asyncio
 async def test_web_search_falls_back_to_serper(monkeypatch):
-    monkeypatch.setenv("TAVILY_API_KEY", "primary-key")
-    monkeypatch.setenv("SERPER_API_KEY", "secondary-key")
-    monkeypatch.setenv("SERPAPI_API_KEY", "tertiary-key")
-
-    async def failing_tavily(*args, **kwargs):
-        raise Exception("boom")
-
-    async def fake_serper(query: str, num_results: int, date_filter, api_key: str):
-        assert api_key == "secondary-key"
-        return [
+    failing_tavily = AsyncMock(side_effect=Exception("boom"))
+    fake_serper = AsyncMock(
+        return_value=[
             {
                 "title": "Fallback result",
                 "snippet": "From serper",
@@ -56,7 +56,7 @@ async def test_web_search_falls_back_to_serper(monkeypatch):
                 "content_type": "web_page",
             }
         ]
-
+    )
     monkeypatch.setattr(web_search_module, "_search_tavily", failing_tavily)
     monkeypatch.setattr(web_search_module, "_search_serper", fake_serper)
 
@@ -64,17 +64,12 @@ async def test_web_search_falls_back_to_serper(monkeypatch):
 
     assert result["provider"] == "serper"
     assert result["total_found"] == 1
+    failing_tavily.assert_awaited_once()
+    fake_serper.assert_awaited_once_with("fallback query", 2, None, "secondary-key")
 
 
-@pytest.mark.asyncio
 async def test_web_search_reports_error_when_all_providers_fail(monkeypatch):
-    monkeypatch.setenv("TAVILY_API_KEY", "primary-key")
-    monkeypatch.setenv("SERPER_API_KEY", "secondary-key")
-    monkeypatch.setenv("SERPAPI_API_KEY", "tertiary-key")
-
-    async def failing_provider(*args, **kwargs):
-        raise Exception("unavailable")
-
+    failing_provider = AsyncMock(side_effect=Exception("unavailable"))
     monkeypatch.setattr(web_search_module, "_search_tavily", failing_provider)
     monkeypatch.setattr(web_search_module, "_search_serper", failing_provider)
     monkeypatch.setattr(web_search_module, "_search_serpapi", failing_provider)
@@ -83,3 +78,166 @@ async def test_web_search_reports_error_when_all_providers_fail(monkeypatch):
 
     assert result["status"] == "error"
     assert result["provider"] == "none"
+    assert failing_provider.await_count == 3
+
+
+async def test_serper_adapter_normalizes_results(monkeypatch):
+    fake_send = AsyncMock(
+        return_value={
+            "organic": [
+                {"title": "Paper", "snippet": "pdf", "link": "https://example.org/a.PDF", "date": "2 days ago"},
+                {"title": "Page", "snippet": "html", "link": "https://www.example.com/b"},
+            ]
+        }
+    )
+    monkeypatch.setattr(web_search_module, "_send_http", fake_send)
+
+    results = await web_search_module._search_serper("query", 2, "week", "secondary-key")
+
+    adapter, *request_args = fake_send.await_args.args
+    request = adapter.build_request(*request_args)
+    assert request["json"]["tbs"] == "qdr:w"
+    assert request["headers"]["X-API-KEY"] == "secondary-key"
+
+    assert [r["domain"] for r in results] == ["example.org", "www.example.com"]
+    assert [r["is_pdf"] for r in results] == [True, False]
+    assert results[0]["date_published"] == "2 days ago"
+    assert "date_published" not in results[1]
+    assert results[1]["relevance_score"] == pytest.approx(0.95)
+
+
+async def test_tavily_posts_directly_to_rest_api(monkeypatch):
+    response = Mock()
+    response.json.return_value = {
+        "results": [{"title": "T", "content": "x" * 600, "url": "https://t.example.com", "score": 0.7}]
+    }
+    client = SimpleNamespace(request=AsyncMock(return_value=response))
+    monkeypatch.setattr(web_search_module, "_get_client", lambda: client)
+
+    results = await web_search_module._search_tavily("query", 3, "month", "primary-key")
+
+    (method, url), kwargs = client.request.await_args
+    assert (method, url) == ("POST", "https://api.tavily.com/search")
+    assert kwargs["json"]["api_key"] == "primary-key"
+    assert kwargs["json"]["time_range"] == "month"
+    assert results[0]["relevance_score"] == 0.7
+    assert len(results[0]["snippet"]) == 500
+
+
+async def test_web_search_only_iterates_configured_providers(monkeypatch):
+    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+    monkeypatch.setenv("SERPER_API_KEY", "secondary-key")
+    monkeypatch.delenv("SERPAPI_API_KEY", raising=False)
+    monkeypatch.setattr(web_search_module, "load_dotenv", lambda **_: None)
+
+    unexpected_provider = AsyncMock()
+    fake_serper = AsyncMock(
+        return_value=[{"title": "Only", "url": "https://only.example.com", "domain": "only.example.com"}]
+    )
+    monkeypatch.setattr(web_search_module, "_search_tavily", unexpected_provider)
+    monkeypatch.setattr(web_search_module, "_search_serper", fake_serper)
+    monkeypatch.setattr(web_search_module, "_search_serpapi", unexpected_provider)
+
+    result = await web_search_module.web_search("single provider", num_results=1)
+
+    assert result["provider"] == "serper"
+    assert web_search_module._get_active_providers() == (("serper", "secondary-key"),)
+    unexpected_provider.assert_not_awaited()
+
+
+async def test_web_search_respects_overall_timeout(monkeypatch):
+    async def stalled_provider(*args, **kwargs):
+        await asyncio.sleep(5)
+        return []
+
+    monkeypatch.setattr(web_search_module, "_search_tavily", stalled_provider)
+    monkeypatch.setattr(web_search_module, "_search_serper", stalled_provider)
+    monkeypatch.setattr(web_search_module, "_search_serpapi", stalled_provider)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await web_search_module.web_search("slow", num_results=1, overall_timeout=0.1)
+
+    assert loop.time() - started < 1.0
+    assert result["status"] == "error"
+    assert "budget" in result["error"]
+
+
+async def test_speculative_search_returns_first_success(monkeypatch):
+    cancelled = []
+
+    async def slow_tavily(*args, **kwargs):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("tavily")
+            raise
+        return []
+
+    async def failing_serper(*args, **kwargs):
+        raise Exception("boom")
+
+    async def fast_serpapi(*args, **kwargs):
+        return [{"title": "Fast", "url": "https://fast.example.com"}]
+
+    monkeypatch.setattr(web_search_module, "_search_tavily", slow_tavily)
+    monkeypatch.setattr(web_search_module, "_search_serper", failing_serper)
+    monkeypatch.setattr(web_search_module, "_search_serpapi", fast_serpapi)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await web_search_module.web_search("fast", num_results=1, speculative=True)
+
+    assert loop.time() - started < 1.0
+    assert result["provider"] == "serpapi"
+    assert cancelled == ["tavily"]
+
+
+async def test_hedged_search_launches_backup_when_primary_is_slow(monkeypatch):
+    called = []
+
+    async def slow_tavily(*args, **kwargs):
+        called.append("tavily")
+        await asyncio.sleep(5)
+        return []
+
+    async def fast_serper(*args, **kwargs):
+        called.append("serper")
+        return [{"title": "Hedged", "url": "https://serper.example.com"}]
+
+    async def unused_serpapi(*args, **kwargs):
+        called.append("serpapi")
+        return []
+
+    monkeypatch.setattr(web_search_module, "_search_tavily", slow_tavily)
+    monkeypatch.setattr(web_search_module, "_search_serper", fast_serper)
+    monkeypatch.setattr(web_search_module, "_search_serpapi", unused_serpapi)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await web_search_module.web_search(
+        "hedge", num_results=1, hedge=True, hedge_delay=0.05
+    )
+
+    assert loop.time() - started < 1.0
+    assert result["provider"] == "serper"
+    assert called == ["tavily", "serper"]
+
+
+def test_shared_client_is_rebuilt_for_a_new_event_loop(monkeypatch):
+    monkeypatch.setattr(web_search_module, "_http_client", None)
+    monkeypatch.setattr(web_search_module, "_http_client_loop", None)
+
+    async def get_client():
+        return web_search_module._get_client()
+
+    clients = []
+    for _ in range(2):
+        loop = asyncio.new_event_loop()
+        try:
+            clients.append(loop.run_until_complete(get_client()))
+            assert loop.run_until_complete(get_client()) is clients[-1]
+        finally:
+            loop.close()
+
+    assert clients[0] is not clients[1]